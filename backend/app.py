@@ -6,6 +6,7 @@ import nest_asyncio
 import datetime
 import queue
 import threading
+from itertools import islice
 from pathlib import Path
 from flask import Flask, request, jsonify, make_response, Response
 from flask_cors import CORS
@@ -371,8 +372,8 @@ def collect_profile_route():
         return jsonify({"error": "Provide at least username, email, or fullname"}), 400
     
     if not identifier and platform_usernames:
-        identifier = "_".join([f"{k}_{v}" if isinstance(v, str) else f"{k}_{v[0]}" 
-                               for k, v in list(platform_usernames.items())[:3]])
+        identifier = "_".join([f"{k}_{v}" if isinstance(v, str) else f"{k}_{v[0]}"
+                               for k, v in islice(platform_usernames.items(), 3)])
 
     identifier = sanitize_identifier(identifier)
 
@@ -9,6 +9,7 @@ import json
 import time
 import re
 from collections import Counter
+from itertools import chain
 from urllib.parse import urlparse
 import logging
 from pathlib import Path
@@ -127,7 +128,7 @@ def analyze_activity(posts, comments):
     all_subs = [p["subreddit"] for p in posts] + [c["subreddit"] for c in comments]
     active_subs = Counter(all_subs).most_common(3)
 
-    timestamps = [p["timestamp"] for p in posts + comments]
+    timestamps = [p["timestamp"] for p in chain(posts, comments)]
     hours = [int(t.split(" ")[1].split(":")[0]) for t in timestamps if " " in t]
     active_hours = Counter(hours).most_common(3)
 
@@ -141,7 +142,7 @@ def analyze_activity(posts, comments):
 
 def collect_external_links(posts, comments):
     links = []
-    for p in posts + comments:
+    for p in chain(posts, comments):
         links.extend(p.get("external_links", []))
     return list(set(links))
 
@@ -5,6 +5,7 @@ report object produced by comprehensive_report.py.  Every field available in the
 correlation output is rendered — nothing is silently truncated or dropped.
 """
 
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -14,8 +15,21 @@ from reportlab.platypus import (
     BaseDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak,
     Flowable, PageTemplate, Frame, KeepTogether,
 )
-from datetime import datetime
+from reportlab.pdfbase import pdfdoc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from io import BytesIO
+from types import SimpleNamespace
+import threading
+import zlib
+
+# ReportLab only exposes page compression on/off, not the zlib level.
+# Level 1 keeps ~90% of the compression at ~4x the speed of the default,
+# which is the right trade for internal reports.
+pdfdoc.zlib = SimpleNamespace(compress=partial(zlib.compress, level=1),
+                              decompress=zlib.decompress,
+                              error=zlib.error)
 
 # ─── Colour palette ──────────────────────────────────────────────────────────
 CYAN        = colors.HexColor("#00B4C8")
@@ -35,6 +49,17 @@ W, H = letter                       # page width / height
 MARGIN = 0.6 * inch
 CONTENT_W = W - 2 * MARGIN          # usable width
 
+# Frame geometry never varies (fixed letter size and margins), so build it
+# once; the doc resets frame state at the start of every page.
+_FRAME = Frame(MARGIN, MARGIN + 0.15 * inch,
+               CONTENT_W, H - 2 * MARGIN - 0.3 * inch, id="main")
+
+# The shared flowables (_FRAME, the rules, cached section paragraphs) and the
+# rl_config toggle all carry state that doc.build rewrites, which is safe for
+# sequential reuse but not for two builds at once. Serialize builds so
+# concurrent report downloads cannot corrupt each other.
+_BUILD_LOCK = threading.Lock()
+
 
 # ─── Helper flowables ────────────────────────────────────────────────────────
 class _Bar(Flowable):
@@ -48,6 +73,12 @@ class _Bar(Flowable):
         self.canv.rect(0, 0, self.width, self.height, fill=1, stroke=0)
 
 
+# _Bar draws statelessly, so the two rules used throughout the report can be
+# single shared instances instead of one allocation per section.
+_RULE = _Bar(CONTENT_W, 1.5, CYAN)
+_RULE_THICK = _Bar(CONTENT_W, 3, CYAN)
+
+
 class _PageBG(PageTemplate):
     """Dark background with cyan header/footer accent bars."""
     def __init__(self, *a, **kw):
@@ -55,23 +86,34 @@ class _PageBG(PageTemplate):
 
     def beforeDrawPage(self, canv, doc):
         canv.saveState()
-        canv.setFillColor(BG_BLACK)
-        canv.rect(0, 0, W, H, fill=1, stroke=0)
-        canv.setFillColor(CYAN)
-        canv.rect(0, H - 6, W, 6, fill=1, stroke=0)
-        canv.rect(0, 0, W, 6, fill=1, stroke=0)
-        canv.setFillColor(BG_DARK)
-        canv.rect(0, 6, 8, H - 12, fill=1, stroke=0)
-
-        # Footer text
+        # The chrome is identical on every page, so emit it once as a Form
+        # XObject and reference it thereafter instead of rewriting the same
+        # operators into each page's content stream.
+        if not getattr(canv, "_bg_form_done", False):
+            canv.beginForm("pageBG")
+            canv.setFillColor(BG_BLACK)
+            canv.rect(0, 0, W, H, fill=1, stroke=0)
+            canv.setFillColor(CYAN)
+            canv.rect(0, H - 6, W, 6, fill=1, stroke=0)
+            canv.rect(0, 0, W, 6, fill=1, stroke=0)
+            canv.setFillColor(BG_DARK)
+            canv.rect(0, 6, 8, H - 12, fill=1, stroke=0)
+            canv.setFont("Helvetica", 7)
+            canv.setFillColor(TEXT_MUTED)
+            canv.drawString(MARGIN, 14, "ShadowHorn Intelligence Platform  •  OSINT — Open Source")
+            canv.endForm()
+            canv._bg_form_done = True
+        canv.doForm("pageBG")
+
+        # Page number varies per page, so it stays outside the form.
         canv.setFont("Helvetica", 7)
         canv.setFillColor(TEXT_MUTED)
-        canv.drawString(MARGIN, 14, "ShadowHorn Intelligence Platform  •  OSINT — Open Source")
         canv.drawRightString(W - MARGIN, 14, f"Page {doc.page}")
         canv.restoreState()
 
 
 # ─── Styles ───────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=1)
 def _styles():
     ss = getSampleStyleSheet()
     ss["Normal"].textColor = TEXT_WHITE
@@ -92,6 +134,15 @@ def _styles():
     return ss
 
 
+# Metric-card styles are identical for every report; build them once.
+_METRIC_STYLE = ParagraphStyle("_m", parent=_styles()["Normal"], fontSize=16,
+                               textColor=CYAN, fontName="Helvetica-Bold",
+                               alignment=TA_CENTER, leading=20)
+_METRIC_LABEL = ParagraphStyle("_ml", parent=_styles()["Normal"], fontSize=8,
+                               textColor=TEXT_MUTED, alignment=TA_CENTER,
+                               leading=10)
+
+
 # ─── Table helpers ────────────────────────────────────────────────────────────
 _GRID = TableStyle([
     ("BACKGROUND",   (0, 0), (-1, 0), BG_CARD),
@@ -111,6 +162,26 @@ _GRID = TableStyle([
     ("LINEBELOW",    (0, 0), (-1, 0), 1.5, CYAN),
 ])
 
+_METRICS_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, -1), BG_CARD),
+    ("ALIGN",      (0, 0), (-1, -1), "CENTER"),
+    ("VALIGN",     (0, 0), (-1, -1), "MIDDLE"),
+    ("TOPPADDING", (0, 0), (-1, 0), 14),
+    ("BOTTOMPADDING", (0, 1), (-1, 1), 10),
+    ("GRID",       (0, 0), (-1, -1), 0.5, colors.HexColor("#2A3544")),
+    ("LINEBELOW",  (0, 0), (-1, 0), 0, BG_CARD),
+])
+
+_TOC_STYLE = TableStyle([
+    ("TEXTCOLOR",    (0, 0), (-1, -1), TEXT_WHITE),
+    ("FONTNAME",     (0, 0), (-1, -1), "Helvetica"),
+    ("FONTSIZE",     (0, 0), (-1, -1), 10),
+    ("VALIGN",       (0, 0), (-1, -1), "MIDDLE"),
+    ("LEFTPADDING",  (0, 0), (-1, -1), 0),
+    ("TOPPADDING",   (0, 0), (-1, -1), 0),
+    ("BOTTOMPADDING",(0, 0), (-1, -1), 0),
+])
+
 _KV_STYLE = TableStyle([
     ("BACKGROUND",   (0, 0), (0, -1), BG_CARD),
     ("BACKGROUND",   (1, 0), (1, -1), BG_DARK),
@@ -125,12 +196,41 @@ _KV_STYLE = TableStyle([
     ("LINEBELOW",    (0, 0), (-1, -1), 0.5, colors.HexColor("#2A3544")),
 ])
 
+# Translation table for XML-escaping Paragraph text in one C-level pass.
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
 def _para(text, style):
     """Wrap text in a Paragraph safely."""
     text = str(text) if text else ""
-    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    # Most narrative bodies contain no markup characters at all; skip the
+    # escape pass (and its copy) for those.
+    if "&" in text or "<" in text or ">" in text:
+        text = text.translate(_XML_ESCAPE)
     return Paragraph(text, style)
 
+@lru_cache(maxsize=128)
+def _static_para(text, style_name):
+    """Cached Paragraph for fixed strings (section headers, boilerplate).
+
+    Reuse across builds is safe for these: they are short enough never to
+    split, and wrap()/draw() recompute their layout state each time.
+    Dynamic content must not go through here.
+    """
+    return Paragraph(text, _styles()[style_name])
+
+
+def _preview(text, n):
+    """Truncate to n chars with a single-codepoint ellipsis; no copy when short."""
+    text = str(text)
+    return text if len(text) <= n else text[:n] + "…"
+
+def _item_lines(items, skip=()):
+    """'<b>label:</b>  value' markup lines, batched into one Paragraph by
+    the caller — one parse/layout pass instead of one per item."""
+    return [f"<b>{_esc(i.get('label'))}:</b>  {_esc(i.get('value'))}"
+            for i in items
+            if i.get("label") and i.get("value") and i.get("label") not in skip]
+
 def _kv_table(rows, styles, col1=2.2*inch):
     """Key-value two-column table."""
     col2 = CONTENT_W - col1
@@ -148,45 +248,103 @@ def _kv_table(rows, styles, col1=2.2*inch):
     return t
 
 
-# ─── Risk colour helper ──────────────────────────────────────────────────────
-def _risk_color(level):
-    l = (level or "").lower()
-    if l in ("critical", "high"):
-        return RED
-    if l in ("medium", "moderate"):
-        return ORANGE
-    return GREEN
+# ─── Risk colour helpers ─────────────────────────────────────────────────────
+# Hex strings for <font color="..."> markup; looking these up directly avoids
+# round-tripping through Color.hexval() and its "#x" prefix quirk.
+_RISK_HEX = {
+    "critical": "#FF5C5C", "high": "#FF5C5C",
+    "medium": "#FFB84D", "moderate": "#FFB84D",
+}
 
-def _priority_color(label):
+def _risk_hex(level):
+    return _RISK_HEX.get((level or "").lower(), "#4CAF50")
+
+def _priority_hex(label):
     l = (label or "").lower()
     if "critical" in l:
-        return RED
+        return "#FF5C5C"
     if "high" in l:
-        return ORANGE
+        return "#FFB84D"
     if "ongoing" in l:
-        return colors.HexColor("#60A5FA")
+        return "#60A5FA"
     if "low" in l:
-        return GREEN
-    return YELLOW
+        return "#4CAF50"
+    return "#FBBF24"
+
+
+# ─── Parsed report ────────────────────────────────────────────────────────────
+@dataclass
+class _ParsedReport:
+    """The report dict's nested .get() chains, resolved once up front."""
+    identifier: str = "Report"
+    name: str = "Report"
+    profile_type: str = ""
+    location: str = ""
+    collection_mode: str = "Standard"
+    compromised: bool = False
+    summary: str = "No summary available."
+    risk_level: str = "Unknown"
+    risk_factors: str = ""
+    counts: dict = field(default_factory=dict)
+    footprint: dict = field(default_factory=dict)
+    platforms: list = field(default_factory=list)
+    repos: list = field(default_factory=list)
+    relationship: dict = field(default_factory=dict)
+    attack_analysis: str = "No data."
+    threat_analysis: str = "No data."
+    iocs: dict = field(default_factory=dict)
+    recommendations: list = field(default_factory=list)
+    pivots: list = field(default_factory=list)
+    ai_narrative: str = ""
+    sections: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, report):
+        meta = report.get("meta") or {}
+        exec_summary = report.get("executive_summary") or {}
+        identifier = meta.get("identifier") or meta.get("name") or "Report"
+        return cls(
+            identifier=identifier,
+            name=meta.get("name") or identifier,
+            profile_type=meta.get("profile_type") or "",
+            location=meta.get("location") or "",
+            collection_mode=(meta.get("collection_mode") or "standard").title(),
+            compromised=bool(meta.get("compromised")),
+            summary=exec_summary.get("summary") or "No summary available.",
+            risk_level=exec_summary.get("risk_level", "Unknown"),
+            risk_factors=exec_summary.get("risk_factors") or "",
+            counts=report.get("counts") or {},
+            footprint=report.get("digital_footprint") or {},
+            platforms=report.get("platform_presence") or [],
+            repos=report.get("repositories") or [],
+            relationship=report.get("relationship_analysis") or {},
+            attack_analysis=(report.get("attack_surface") or {}).get("analysis", "No data."),
+            threat_analysis=(report.get("threat_analysis") or {}).get("analysis", "No data."),
+            iocs=report.get("indicators_of_compromise") or {},
+            recommendations=report.get("recommendations") or [],
+            pivots=report.get("investigation_pivots") or [],
+            ai_narrative=report.get("ai_narrative") or "",
+            sections=report.get("sections") or [],
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  build_pdf_bytes — main entry point
 # ═══════════════════════════════════════════════════════════════════════════════
 def build_pdf_bytes(report: dict) -> bytes:
-    meta = report.get("meta", {})
-    identifier = meta.get("identifier") or meta.get("name") or "Report"
-    name = meta.get("name") or identifier
-    exec_summary = report.get("executive_summary", {})
+    pr = _ParsedReport.from_dict(report)
+    identifier = pr.identifier
+    name = pr.name
 
     buf = BytesIO()
+    # zlib level 1 gets ~90% of the compression at a fraction of the CPU of
+    # the default level; these reports are internal, size is not critical.
     doc = BaseDocTemplate(buf, pagesize=letter,
                           leftMargin=MARGIN, rightMargin=MARGIN,
                           topMargin=MARGIN + 0.15 * inch,
-                          bottomMargin=MARGIN + 0.15 * inch)
-    frame = Frame(MARGIN, MARGIN + 0.15 * inch,
-                  CONTENT_W, H - 2 * MARGIN - 0.3 * inch, id="main")
-    doc.addPageTemplates([_PageBG(id="bg", frames=[frame])])
+                          bottomMargin=MARGIN + 0.15 * inch,
+                          pageCompression=1)
+    doc.addPageTemplates([_PageBG(id="bg", frames=[_FRAME])])
 
     S = _styles()
     body = S["Body"]
@@ -195,78 +353,72 @@ def build_pdf_bytes(report: dict) -> bytes:
 
     # ── COVER PAGE ────────────────────────────────────────────────────────
     els.append(Spacer(1, 1.2 * inch))
-    els.append(Paragraph("INTELLIGENCE REPORT", S["Cover"]))
-    els.append(_Bar(CONTENT_W, 3, CYAN))
+    els.append(_static_para("INTELLIGENCE REPORT", "Cover"))
+    els.append(_RULE_THICK)
     els.append(Spacer(1, 0.15 * inch))
-    els.append(Paragraph(f"Subject: {name}", S["CoverSub"]))
-    profile_type = meta.get("profile_type") or ""
-    if profile_type:
-        els.append(Paragraph(profile_type.title(), S["CoverSub"]))
+    els.append(Paragraph(f"Subject: {_esc(name)}", S["CoverSub"]))
+    if pr.profile_type:
+        els.append(Paragraph(_esc(pr.profile_type.title()), S["CoverSub"]))
     els.append(Spacer(1, 0.4 * inch))
 
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     cover_rows = [
         ("Report Date", now.strftime("%B %d, %Y")),
         ("Report Time", now.strftime("%H:%M:%S UTC")),
         ("Report Type", "Comprehensive Intelligence Analysis"),
         ("Identifier", identifier),
-        ("Location", meta.get("location")),
-        ("Collection Mode", (meta.get("collection_mode") or "standard").title()),
-        ("Compromise Status", "COMPROMISED" if meta.get("compromised") else "Not Compromised"),
+        ("Location", pr.location),
+        ("Collection Mode", pr.collection_mode),
+        ("Compromise Status", "COMPROMISED" if pr.compromised else "Not Compromised"),
     ]
     t = _kv_table(cover_rows, S)
     if t:
         els.append(t)
 
     els.append(Spacer(1, 0.3 * inch))
-    risk_level = exec_summary.get("risk_level", "Unknown")
-    rc = _risk_color(risk_level)
-    hex_c = rc.hexval() if hasattr(rc, "hexval") else str(rc)
-    if hex_c.startswith("#x"):
-        hex_c = "#" + hex_c[2:]
-    els.append(Paragraph(f'Overall Risk Level: <font color="{hex_c}"><b>{risk_level.upper()}</b></font>', body))
+    risk_level = pr.risk_level
+    hex_c = _risk_hex(risk_level)
+    els.append(Paragraph(f'Overall Risk Level: <font color="{hex_c}"><b>{_esc(risk_level.upper())}</b></font>', body))
     els.append(PageBreak())
 
     # ── TABLE OF CONTENTS ─────────────────────────────────────────────────
+    # Plain strings in one table: a single layout/draw pass and no paragraph
+    # parsing for fifteen static entries.
     toc_items = [
         "Executive Summary", "Key Metrics", "Digital Footprint Analysis",
-        "Platform Presence", "Repository Analysis", "Content &amp; Posts",
-        "Behavior &amp; Interests", "Relationship Network", "Activity Timeline",
+        "Platform Presence", "Repository Analysis", "Content & Posts",
+        "Behavior & Interests", "Relationship Network", "Activity Timeline",
         "Attack Surface Assessment", "Threat Analysis",
         "Indicators of Compromise", "Recommendations",
         "Investigation Pivots", "AI Narrative",
     ]
-    els.append(Paragraph("TABLE OF CONTENTS", S["Section"]))
-    els.append(_Bar(CONTENT_W, 1.5, CYAN))
+    els.append(_static_para("TABLE OF CONTENTS", "Section"))
+    els.append(_RULE)
     els.append(Spacer(1, 0.15 * inch))
-    for i, item in enumerate(toc_items, 1):
-        els.append(Paragraph(f"{i}.  {item}", body))
+    toc_table = Table([[f"{i}.  {item}"] for i, item in enumerate(toc_items, 1)],
+                      colWidths=[CONTENT_W],
+                      rowHeights=[0.24 * inch] * len(toc_items))
+    toc_table.setStyle(_TOC_STYLE)
+    els.append(toc_table)
     els.append(PageBreak())
 
     # ── 1. EXECUTIVE SUMMARY ──────────────────────────────────────────────
-    els.append(Paragraph("1.  EXECUTIVE SUMMARY", S["Section"]))
-    els.append(_Bar(CONTENT_W, 1.5, CYAN))
+    els.append(_static_para("1.  EXECUTIVE SUMMARY", "Section"))
+    els.append(_RULE)
     els.append(Spacer(1, 0.1 * inch))
-    summary_text = exec_summary.get("summary") or "No summary available."
-    els.append(_para(summary_text, body))
-    risk_factors = exec_summary.get("risk_factors")
+    els.append(_para(pr.summary, body))
+    risk_factors = pr.risk_factors
     if risk_factors and risk_factors != "Minimal risk indicators":
         els.append(Spacer(1, 0.05 * inch))
-        els.append(Paragraph(f'Risk Factors: <font color="{hex_c}"><b>{risk_factors}</b></font>', S["BodySmall"]))
+        els.append(Paragraph(f'Risk Factors: <font color="{hex_c}"><b>{_esc(risk_factors)}</b></font>', S["BodySmall"]))
     els.append(Spacer(1, 0.15 * inch))
 
     # ── 2. KEY METRICS ────────────────────────────────────────────────────
-    counts = report.get("counts", {})
-    els.append(Paragraph("2.  KEY METRICS", S["Section"]))
-    els.append(_Bar(CONTENT_W, 1.5, CYAN))
+    counts = pr.counts
+    els.append(_static_para("2.  KEY METRICS", "Section"))
+    els.append(_RULE)
     els.append(Spacer(1, 0.1 * inch))
 
-    metric_style = ParagraphStyle("_m", parent=S["Normal"], fontSize=16,
-                                  textColor=CYAN, fontName="Helvetica-Bold",
-                                  alignment=TA_CENTER, leading=20)
-    metric_label = ParagraphStyle("_ml", parent=S["Normal"], fontSize=8,
-                                  textColor=TEXT_MUTED, alignment=TA_CENTER,
-                                  leading=10)
     mc = [
         (str(counts.get("identifiers", 0)), "Identifiers"),
         (str(counts.get("platforms", 0)), "Platforms"),
@@ -277,26 +429,18 @@ def build_pdf_bytes(report: dict) -> bytes:
     metric_row = []
     label_row = []
     for val, lbl in mc:
-        metric_row.append(Paragraph(f"<b>{val}</b>", metric_style))
-        label_row.append(Paragraph(lbl, metric_label))
+        metric_row.append(Paragraph(f"<b>{val}</b>", _METRIC_STYLE))
+        label_row.append(Paragraph(lbl, _METRIC_LABEL))
     cw = CONTENT_W / len(mc)
     mt = Table([metric_row, label_row], colWidths=[cw] * len(mc))
-    mt.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, -1), BG_CARD),
-        ("ALIGN",      (0, 0), (-1, -1), "CENTER"),
-        ("VALIGN",     (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING", (0, 0), (-1, 0), 14),
-        ("BOTTOMPADDING", (0, 1), (-1, 1), 10),
-        ("GRID",       (0, 0), (-1, -1), 0.5, colors.HexColor("#2A3544")),
-        ("LINEBELOW",  (0, 0), (-1, 0), 0, BG_CARD),
-    ]))
+    mt.setStyle(_METRICS_STYLE)
     els.append(mt)
     els.append(Spacer(1, 0.15 * inch))
 
     # ── 3. DIGITAL FOOTPRINT ──────────────────────────────────────────────
-    df = report.get("digital_footprint", {})
-    els.append(Paragraph("3.  DIGITAL FOOTPRINT ANALYSIS", S["Section"]))
-    els.append(_Bar(CONTENT_W, 1.5, CYAN))
+    df = pr.footprint
+    els.append(_static_para("3.  DIGITAL FOOTPRINT ANALYSIS", "Section"))
+    els.append(_RULE)
     els.append(Spacer(1, 0.1 * inch))
     els.append(_para(df.get("analysis", "No data available."), body))
     df_kv = _kv_table([
@@ -308,16 +452,16 @@ def build_pdf_bytes(report: dict) -> bytes:
     els.append(PageBreak())
 
     # ── 4. PLATFORM PRESENCE ──────────────────────────────────────────────
-    platforms = report.get("platform_presence", [])
+    platforms = pr.platforms
     if platforms:
-        els.append(Paragraph("4.  PLATFORM PRESENCE", S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_static_para("4.  PLATFORM PRESENCE", "Section"))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
         hdr = [
-            Paragraph("<b>Platform</b>", S["Label"]),
-            Paragraph("<b>Username</b>", S["Label"]),
-            Paragraph("<b>URL</b>", S["Label"]),
-            Paragraph("<b>Bio</b>", S["Label"]),
+            _static_para("<b>Platform</b>", "Label"),
+            _static_para("<b>Username</b>", "Label"),
+            _static_para("<b>URL</b>", "Label"),
+            _static_para("<b>Bio</b>", "Label"),
         ]
         rows = [hdr]
         for p in platforms:
@@ -333,21 +477,21 @@ def build_pdf_bytes(report: dict) -> bytes:
         els.append(Spacer(1, 0.15 * inch))
 
     # ── 5. REPOSITORIES ──────────────────────────────────────────────────
-    repos = report.get("repositories", [])
+    repos = pr.repos
     if repos:
         els.append(Paragraph(f"5.  REPOSITORY ANALYSIS ({len(repos)})", S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
         hdr = [
-            Paragraph("<b>Repository</b>", S["Label"]),
-            Paragraph("<b>Language</b>", S["Label"]),
-            Paragraph("<b>Stars</b>", S["Label"]),
-            Paragraph("<b>Forks</b>", S["Label"]),
-            Paragraph("<b>Description</b>", S["Label"]),
+            _static_para("<b>Repository</b>", "Label"),
+            _static_para("<b>Language</b>", "Label"),
+            _static_para("<b>Stars</b>", "Label"),
+            _static_para("<b>Forks</b>", "Label"),
+            _static_para("<b>Description</b>", "Label"),
         ]
         rows = [hdr]
         for r in repos:
-            desc = (r.get("description") or "—")[:80]
+            desc = _preview(r.get("description") or "—", 80)
             rows.append([
                 _para(r.get("name", "—"), body),
                 _para(r.get("language") or "—", S["BodySmall"]),
@@ -365,32 +509,32 @@ def build_pdf_bytes(report: dict) -> bytes:
     _render_section_items(els, S, report, "Content & Posts", "content", "6")
 
     # ── 7. BEHAVIOR & INTERESTS ───────────────────────────────────────────
-    els.append(Paragraph("7.  BEHAVIOR &amp; INTERESTS", S["Section"]))
-    els.append(_Bar(CONTENT_W, 1.5, CYAN))
+    els.append(_static_para("7.  BEHAVIOR &amp; INTERESTS", "Section"))
+    els.append(_RULE)
     els.append(Spacer(1, 0.1 * inch))
 
     _render_section_items(els, S, report, "Behavior", "behavior", None, bare=True)
 
     activity = _find_section_value(report, "activity_patterns", "Activity Pattern")
     if activity:
-        els.append(Paragraph("Activity Patterns", S["SubSection"]))
+        els.append(_static_para("Activity Patterns", "SubSection"))
         els.append(_para(activity, body))
 
     interests = _find_section_value(report, "behavior", "Identified Interests")
     if interests:
-        els.append(Paragraph("Interests", S["SubSection"]))
+        els.append(_static_para("Interests", "SubSection"))
         els.append(_para(interests, body))
 
     anomalies = _find_section_value(report, "behavior", "Behavioral Anomalies")
     if anomalies:
-        els.append(Paragraph("Behavioral Anomalies", S["SubSection"]))
+        els.append(_static_para("Behavioral Anomalies", "SubSection"))
         els.append(_para(anomalies, body))
     els.append(Spacer(1, 0.15 * inch))
 
     # ── 8. RELATIONSHIP NETWORK ───────────────────────────────────────────
-    rel = report.get("relationship_analysis", {})
-    els.append(Paragraph("8.  RELATIONSHIP NETWORK", S["Section"]))
-    els.append(_Bar(CONTENT_W, 1.5, CYAN))
+    rel = pr.relationship
+    els.append(_static_para("8.  RELATIONSHIP NETWORK", "Section"))
+    els.append(_RULE)
     els.append(Spacer(1, 0.1 * inch))
     els.append(_para(rel.get("summary", "No relationship data available."), body))
     conn_count = rel.get("connection_count", 0)
@@ -399,65 +543,64 @@ def build_pdf_bytes(report: dict) -> bytes:
 
     rel_section = _find_generic_section(report, "Relationship")
     if rel_section:
-        for item in rel_section.get("items", []):
-            lbl = item.get("label", "")
-            val = item.get("value", "")
-            if lbl and val and lbl not in ("Total Connections",):
-                els.append(Paragraph(f"<b>{lbl}:</b>  {val}", S["BodySmall"]))
+        lines = _item_lines(rel_section.get("items", []), skip=("Total Connections",))
+        if lines:
+            els.append(Paragraph("<br/>".join(lines), S["BodySmall"]))
     els.append(Spacer(1, 0.15 * inch))
 
     # ── 9. ACTIVITY TIMELINE ──────────────────────────────────────────────
     timeline_sec = _find_generic_section(report, "Evidence") or _find_generic_section(report, "Timeline")
     if timeline_sec and timeline_sec.get("items"):
-        els.append(Paragraph("9.  ACTIVITY TIMELINE", S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_static_para("9.  ACTIVITY TIMELINE", "Section"))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
+        lines = []
         for item in timeline_sec["items"]:
             val = item.get("value", "")
             lbl = item.get("label", "")
             if val:
                 if lbl and lbl not in val:
-                    els.append(Paragraph(f"<b>{lbl}:</b>  {val}", S["BodySmall"]))
+                    lines.append(f"<b>{_esc(lbl)}:</b>  {_esc(val)}")
                 else:
-                    els.append(_para(val, S["BodySmall"]))
+                    lines.append(_esc(val))
+        if lines:
+            els.append(Paragraph("<br/>".join(lines), S["BodySmall"]))
         els.append(Spacer(1, 0.15 * inch))
     els.append(PageBreak())
 
     # ── 10. ATTACK SURFACE ────────────────────────────────────────────────
-    els.append(Paragraph("10.  ATTACK SURFACE ASSESSMENT", S["Section"]))
-    els.append(_Bar(CONTENT_W, 1.5, CYAN))
+    els.append(_static_para("10.  ATTACK SURFACE ASSESSMENT", "Section"))
+    els.append(_RULE)
     els.append(Spacer(1, 0.1 * inch))
-    els.append(_para(report.get("attack_surface", {}).get("analysis", "No data."), body))
+    els.append(_para(pr.attack_analysis, body))
 
     attack_sec = _find_generic_section(report, "Attack Surface")
     if attack_sec:
-        for item in attack_sec.get("items", []):
-            lbl, val = item.get("label", ""), item.get("value", "")
-            if lbl and val:
-                els.append(Paragraph(f"<b>{lbl}:</b>  {val}", S["BodySmall"]))
+        lines = _item_lines(attack_sec.get("items", []))
+        if lines:
+            els.append(Paragraph("<br/>".join(lines), S["BodySmall"]))
     els.append(Spacer(1, 0.15 * inch))
 
     # ── 11. THREAT ANALYSIS ───────────────────────────────────────────────
-    els.append(Paragraph("11.  THREAT ANALYSIS", S["Section"]))
-    els.append(_Bar(CONTENT_W, 1.5, CYAN))
+    els.append(_static_para("11.  THREAT ANALYSIS", "Section"))
+    els.append(_RULE)
     els.append(Spacer(1, 0.1 * inch))
-    els.append(_para(report.get("threat_analysis", {}).get("analysis", "No data."), body))
+    els.append(_para(pr.threat_analysis, body))
 
     threat_sec = _find_generic_section(report, "Threat Assessment")
     if threat_sec:
-        for item in threat_sec.get("items", []):
-            lbl, val = item.get("label", ""), item.get("value", "")
-            if lbl and val:
-                els.append(Paragraph(f"<b>{lbl}:</b>  {val}", S["BodySmall"]))
+        lines = _item_lines(threat_sec.get("items", []))
+        if lines:
+            els.append(Paragraph("<br/>".join(lines), S["BodySmall"]))
     els.append(Spacer(1, 0.15 * inch))
     els.append(PageBreak())
 
     # ── 12. INDICATORS OF COMPROMISE ──────────────────────────────────────
-    iocs = report.get("indicators_of_compromise", {})
+    iocs = pr.iocs
     has_iocs = any(iocs.get(k) for k in ("emails", "accounts", "platform_urls", "repository_urls"))
     if has_iocs:
-        els.append(Paragraph("12.  INDICATORS OF COMPROMISE", S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_static_para("12.  INDICATORS OF COMPROMISE", "Section"))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
         ioc_groups = [
             ("Email Addresses", iocs.get("emails", [])),
@@ -469,11 +612,13 @@ def build_pdf_bytes(report: dict) -> bytes:
             if not items:
                 continue
             els.append(Paragraph(group_name, S["SubSection"]))
-            hdr = [Paragraph("<b>#</b>", S["Label"]),
+            hdr = [_static_para("<b>#</b>", "Label"),
                    Paragraph(f"<b>{group_name}</b>", S["Label"])]
             rows = [hdr]
-            for i, item in enumerate(items, 1):
-                rows.append([_para(str(i), muted), _para(str(item), S["BodySmall"])])
+            escaped = [_esc(str(it)) for it in items]
+            for i, text in enumerate(escaped, 1):
+                rows.append([Paragraph(str(i), muted),
+                             Paragraph(text, S["BodySmall"])])
             t = Table(rows, colWidths=[0.4 * inch, CONTENT_W - 0.4 * inch])
             t.setStyle(_GRID)
             els.append(t)
@@ -481,32 +626,31 @@ def build_pdf_bytes(report: dict) -> bytes:
         els.append(Spacer(1, 0.1 * inch))
 
     # ── 13. RECOMMENDATIONS ───────────────────────────────────────────────
-    recs = report.get("recommendations", [])
+    recs = pr.recommendations
     if recs:
-        els.append(Paragraph("13.  RECOMMENDATIONS", S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_static_para("13.  RECOMMENDATIONS", "Section"))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
+        lines = []
         for rec in recs:
             if not isinstance(rec, dict):
                 continue
             priority = rec.get("priority", "MEDIUM")
             action = rec.get("action", "")
-            pc = _priority_color(priority)
-            hex_p = pc.hexval() if hasattr(pc, "hexval") else str(pc)
-            if hex_p.startswith("#x"):
-                hex_p = "#" + hex_p[2:]
-            els.append(Paragraph(
-                f'<font color="{hex_p}"><b>[{priority}]</b></font>  {_esc(action)}',
-                S["BulletItem"],
-            ))
+            lines.append(
+                f'<font color="{_priority_hex(priority)}"><b>[{_esc(priority)}]</b></font>'
+                f'  {_esc(action)}'
+            )
+        if lines:
+            els.append(Paragraph("<br/>".join(lines), S["BulletItem"]))
         els.append(Spacer(1, 0.15 * inch))
     els.append(PageBreak())
 
     # ── 14. INVESTIGATION PIVOTS ──────────────────────────────────────────
-    pivots = report.get("investigation_pivots", [])
+    pivots = pr.pivots
     if pivots:
-        els.append(Paragraph("14.  INVESTIGATION PIVOTS", S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_static_para("14.  INVESTIGATION PIVOTS", "Section"))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
         for p in pivots:
             if not isinstance(p, dict):
@@ -516,10 +660,10 @@ def build_pdf_bytes(report: dict) -> bytes:
         els.append(Spacer(1, 0.15 * inch))
 
     # ── 15. AI NARRATIVE ──────────────────────────────────────────────────
-    ai = report.get("ai_narrative", "")
+    ai = pr.ai_narrative
     if ai:
-        els.append(Paragraph("15.  AI INTELLIGENCE NARRATIVE", S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_static_para("15.  AI INTELLIGENCE NARRATIVE", "Section"))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
         els.append(_para(ai, body))
         els.append(Spacer(1, 0.15 * inch))
@@ -533,7 +677,7 @@ def build_pdf_bytes(report: dict) -> bytes:
         "threat assessment", "ai analysis", "prioritized recommendations",
         "investigation",
     }
-    for sec in report.get("sections", []):
+    for sec in pr.sections:
         title_lower = (sec.get("title") or "").lower()
         if any(rt in title_lower for rt in rendered_titles):
             continue
@@ -541,26 +685,32 @@ def build_pdf_bytes(report: dict) -> bytes:
         if not items:
             continue
         els.append(Paragraph(_esc(sec["title"]), S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
-        for item in items:
-            lbl = item.get("label", "")
-            val = item.get("value", "")
-            if lbl and val:
-                els.append(Paragraph(f"<b>{_esc(lbl)}:</b>  {_esc(val)}", S["BodySmall"]))
+        lines = _item_lines(items)
+        if lines:
+            els.append(Paragraph("<br/>".join(lines), S["BodySmall"]))
         els.append(Spacer(1, 0.1 * inch))
 
     # ── END PAGE ──────────────────────────────────────────────────────────
     els.append(PageBreak())
     els.append(Spacer(1, 2.5 * inch))
-    els.append(Paragraph("END OF REPORT", S["Cover"]))
-    els.append(_Bar(CONTENT_W, 3, CYAN))
+    els.append(_static_para("END OF REPORT", "Cover"))
+    els.append(_RULE_THICK)
     els.append(Spacer(1, 0.2 * inch))
-    els.append(Paragraph("ShadowHorn Intelligence Platform", S["CoverSub"]))
+    els.append(_static_para("ShadowHorn Intelligence Platform", "CoverSub"))
     els.append(Paragraph(f"Generated {now.strftime('%B %d, %Y at %H:%M UTC')}", S["Muted"]))
-    els.append(Paragraph("Classification: OSINT — Open Source", S["Muted"]))
-
-    doc.build(els)
+    els.append(_static_para("Classification: OSINT — Open Source", "Muted"))
+
+    # shapeChecking validates every attribute set on every graphics primitive;
+    # with the number of flowables a full report emits it is pure overhead.
+    with _BUILD_LOCK:
+        _prev_shape_checking = rl_config.shapeChecking
+        rl_config.shapeChecking = 0
+        try:
+            doc.build(els)
+        finally:
+            rl_config.shapeChecking = _prev_shape_checking
     buf.seek(0)
     return buf.getvalue()
 
@@ -569,13 +719,15 @@ def build_pdf_bytes(report: dict) -> bytes:
 def _esc(text):
     """XML-escape text for Paragraph."""
     text = str(text) if text else ""
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    if "&" in text or "<" in text or ">" in text:
+        return text.translate(_XML_ESCAPE)
+    return text
 
 
 def _find_generic_section(report, keyword):
     """Find a section by keyword in title."""
     kw = keyword.lower()
-    for sec in report.get("sections", []):
+    for sec in report.get("sections") or []:
         if kw in (sec.get("title") or "").lower():
             return sec
     return None
@@ -600,10 +752,8 @@ def _render_section_items(els, S, report, keyword, prefix, number, bare=False):
         return
     if not bare and number:
         els.append(Paragraph(f"{number}.  {_esc(sec.get('title', keyword))}", S["Section"]))
-        els.append(_Bar(CONTENT_W, 1.5, CYAN))
+        els.append(_RULE)
         els.append(Spacer(1, 0.1 * inch))
-    for item in sec["items"]:
-        lbl = item.get("label", "")
-        val = item.get("value", "")
-        if lbl and val:
-            els.append(Paragraph(f"<b>{_esc(lbl)}:</b>  {_esc(val)}", S["BodySmall"]))
+    lines = _item_lines(sec["items"])
+    if lines:
+        els.append(Paragraph("<br/>".join(lines), S["BodySmall"]))
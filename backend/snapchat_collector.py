@@ -10,7 +10,11 @@ Usage:
 """
 
 import argparse
+import asyncio
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field as dc_field
+from itertools import islice
 import json
 import logging
 import os
@@ -20,10 +24,35 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from urllib3.util.retry import Retry
+
+try:  # fast C parser for the JSON-LD blocks; stdlib json works too
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+try:  # C-backed HTML parsing for <title>/<meta>; regex fallback below
+    from lxml import etree as _etree
+    _HTML_PARSER = _etree.HTMLParser(collect_ids=False)
+except ImportError:
+    _etree = None
+    _HTML_PARSER = None
+
+try:  # on-disk HTTP cache so repeated CLI runs skip identical GETs
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
 
 # Platform-independent path handling
 DEFAULT_OUTPUT_DIR = Path.home() / "SnapchatDownloads"
-SESSION = requests.Session()
 
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -33,6 +62,176 @@ DEFAULT_HEADERS = {
     "Connection": "keep-alive",
 }
 
+def _make_session(cached: bool = True) -> requests.Session:
+    """Build the shared session; cached=False forces a plain requests.Session."""
+    session = None
+    if cached and CachedSession is not None:
+        try:
+            DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+            session = CachedSession(
+                str(DEFAULT_OUTPUT_DIR / "http_cache"), backend="sqlite",
+                expire_after=300, allowable_codes=(200,))
+        except Exception as e:
+            logging.warning("HTTP cache unavailable (%s); using a plain session", e)
+    if session is None:
+        session = requests.Session()
+
+    session.headers.update(DEFAULT_HEADERS)
+    # Keep-alive pool wide enough for the concurrent per-user fetches plus
+    # batch use from the Flask side; transient upstream errors retry instead
+    # of eating the whole 10 s timeout budget.
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=32, pool_maxsize=32,
+        max_retries=Retry(total=2, connect=2, backoff_factor=0.2,
+                          status_forcelist=[502, 503, 504]))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _make_session()
+
+# ─── Precompiled patterns ────────────────────────────────────────────────────
+# Every extractor below runs against each fetched page; compiling the patterns
+# once at import avoids the per-call re cache lookups (and cache eviction —
+# this module alone holds ~60 patterns).
+
+_OG_FIELDS = [
+    "og:title", "og:description", "og:image", "og:url",
+    "og:type", "twitter:creator", "twitter:image", "twitter:title"
+]
+_OG_RES = [(field.replace(":", "_"), re.compile(rf'{field}" content="([^"]+)"'))
+           for field in _OG_FIELDS]
+_OG_FIELD_SET = frozenset(_OG_FIELDS)
+
+_TITLE_RE = re.compile(r"<title>([^<]+)</title>")
+_DISPLAY_NAME_RE = re.compile(r'"displayName"\s*:\s*"([^"]+)"')
+_PAGE_BIO_RES = [
+    re.compile(r'"description"\s*:\s*"([^"]+)"'),
+    re.compile(r'"bio"\s*:\s*"([^"]+)"'),
+    re.compile(r'<meta name="description" content="([^"]+)"'),
+]
+
+_JSON_LD_RE = re.compile(
+    r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL)
+_NEXT_DATA_RE = re.compile(
+    r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# All simple `"key": value` JSON attributes scanned by the profile/account
+# extractors, fused into one alternation. One finditer pass over the document
+# replaces ~25 whole-document re.search passes; the first value seen per key
+# wins, matching the old per-pattern search semantics.
+_JSON_ATTR_KEYS = (
+    "displayName|name|bio|description|image|website|url|location|city|"
+    "postalCode|zipCode|birthday|dob|dateOfBirth|age|years|gender|"
+    "relationshipStatus|relationship|phoneNumber|phone|email|contactEmail|"
+    "timezone|timeZone|userId|id|uniqueId|snapScore|createdDate|created|joined"
+)
+_JSON_ATTR_RE = re.compile(
+    rf'"(?P<key>{_JSON_ATTR_KEYS})"\s*:\s*(?:"(?P<val>[^"]+)"|(?P<num>\d+))',
+    re.IGNORECASE)
+
+# Meta-tag fallbacks used when the JSON attributes are absent
+_OG_TITLE_META_RE = re.compile(r'<meta property="og:title" content="([^"]+)"', re.IGNORECASE)
+_OG_IMAGE_META_RE = re.compile(r'og:image" content="([^"]+)"', re.IGNORECASE)
+
+# Per-field value validators (run on the short captured values, not the page)
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}$')
+_SLASH_DATE_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}$')
+_PHONE_VAL_RE = re.compile(r'[+\d\s\-().]+$')
+_EMAIL_VAL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$')
+_GENDER_VALUES = frozenset({"m", "f", "male", "female", "other"})
+
+# Used to parse the interests array in place (handles escaped quotes and
+# nested values that a lazy regex capture would mangle)
+_JSON_DECODER = json.JSONDecoder()
+
+# Marker words the extractors test for; scanned in one case-insensitive pass
+# instead of each extractor allocating its own html.lower() copy.
+_KEYWORD_SCAN_RE = re.compile(
+    r'\b(verified|ghostmode|ghost|story|business|iphone|ios|android|web)\b',
+    re.IGNORECASE)
+# Bytes pattern so visibility can be probed on the raw response body in one
+# sweep. No word boundaries: the tokens usually appear inside camelCase
+# identifiers such as publicProfileInfo.
+_PUBPRIV_RE = re.compile(rb'(public|private)', re.IGNORECASE)
+
+_COUNT_RES = {
+    "follower_count": [
+        re.compile(r'"followers"\s*:\s*(\d+)', re.IGNORECASE),
+        re.compile(r'>(\d+)\s*followers?<', re.IGNORECASE),
+    ],
+    "following_count": [
+        re.compile(r'"following"\s*:\s*(\d+)', re.IGNORECASE),
+        re.compile(r'>(\d+)\s*following<', re.IGNORECASE),
+    ],
+    "friend_count": [
+        re.compile(r'"friends"\s*:\s*(\d+)', re.IGNORECASE),
+    ],
+}
+
+_USER_PHONE_RES = [
+    re.compile(r'"phoneNumber"\s*:\s*"([+\d\s\-().]+)"', re.IGNORECASE),
+    re.compile(r'"phone"\s*:\s*"([+\d\s\-().]+)"', re.IGNORECASE),
+    re.compile(r'"userPhone"\s*:\s*"([+\d\s\-().]+)"', re.IGNORECASE),
+]
+_USER_EMAIL_RES = [
+    re.compile(r'"email"\s*:\s*"([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})"', re.IGNORECASE),
+    re.compile(r'"userEmail"\s*:\s*"([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})"', re.IGNORECASE),
+]
+# Linked-account URLs for all platforms fused into one alternation (one scan
+# instead of five); the JSON-field variants stay as a small compiled list.
+_SOCIAL_URL_RE = re.compile(
+    r'(instagram|twitter|facebook|tiktok|youtube)\.com/@?([A-Za-z0-9_.\-]+)',
+    re.IGNORECASE)
+_SOCIAL_JSON_RES = [
+    (platform, re.compile(rf'"{platform}"\s*:\s*"([^"]+)"', re.IGNORECASE))
+    for platform in ("instagram", "twitter", "facebook", "tiktok", "youtube")
+]
+
+_BIO_RES = [
+    re.compile(r'"bio"\s*:\s*"([^"]+)"', re.IGNORECASE),
+    re.compile(r'"description"\s*:\s*"([^"]+)"', re.IGNORECASE),
+]
+_BIO_PHONE_RES = [
+    # International format: +1234567890, +92-300-1234567.
+    # Anchored on digits with at most one separator between them, so prose
+    # full of spaces/dashes can't feed runaway matches.
+    (re.compile(r'(?<!\d)\+?(?:\d[\s\-().]?){9,15}\d(?!\d)'), 'international'),
+    # US format: (123) 456-7890, 123-456-7890
+    (re.compile(r'(?:\+?1[-.\s]?)?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})'), 'us'),
+    # Pakistan format: 03001234567, +923001234567
+    (re.compile(r'(?:\+92|0)?3\d{2}[-.\s]?\d{7}'), 'pakistan'),
+    # Generic: Call/Contact/Phone followed by number (bounded so a run of
+    # separators after the label can't balloon the capture)
+    (re.compile(r'(?:Call|Contact|Phone|Tel|Mobile|WhatsApp)\s{0,4}[:=]?\s{0,4}([+\d\s\-().]{7,24})'), 'labeled'),
+]
+_WHATSAPP_RES = [
+    re.compile(r'wa\.me/(\d+)', re.IGNORECASE),
+    re.compile(r'whatsapp\.com/send\?phone=(\d+)', re.IGNORECASE),
+    re.compile(r'(?:WhatsApp|wa)[\s:]{0,4}(\d{6,15})', re.IGNORECASE),
+    re.compile(r'chat\.whatsapp\.com/([A-Za-z0-9_-]+)', re.IGNORECASE),
+]
+_TELEGRAM_RES = [
+    re.compile(r't\.me/([a-zA-Z0-9_]+)', re.IGNORECASE),
+    re.compile(r'telegram\.me/([a-zA-Z0-9_]+)', re.IGNORECASE),
+    re.compile(r'(?:Telegram|TG)[\s:]{0,4}(@?[a-zA-Z0-9_]{3,32})', re.IGNORECASE),
+]
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_URL_RE = re.compile(r'https?://[^\s]+')
+# Deletes everything but digits in one C-level pass (the captured phone
+# strings are ASCII by construction of the patterns above)
+_NON_DIGIT_TBL = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit()))
+
+_LAST_SEEN_RES = [
+    re.compile(r'last\s+(?:seen|active)["\']?\s*:\s*["\']?([^"\'<>]+)', re.IGNORECASE),
+]
+_CREATION_RES = [
+    re.compile(r'joined["\']?\s*:\s*["\']?([^"\'<>]+)', re.IGNORECASE),
+    re.compile(r'created["\']?\s*:\s*["\']?(\d{4}-\d{2}-\d{2})', re.IGNORECASE),
+]
+
 
 def setup_logging(log_dir: Optional[str] = None) -> str:
     """Initialize logging configuration."""
@@ -40,7 +239,7 @@ def setup_logging(log_dir: Optional[str] = None) -> str:
         log_dir = str(DEFAULT_OUTPUT_DIR / "logs")
     
     os.makedirs(log_dir, exist_ok=True)
-    ts = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    ts = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d_%H%M%S")
     path = os.path.join(log_dir, f"snapchat_scraper_{ts}.log")
     
     logging.basicConfig(
@@ -55,23 +254,44 @@ def setup_logging(log_dir: Optional[str] = None) -> str:
     return path
 
 
-def extract_og_metadata(html: str) -> Dict[str, str]:
+def _parse_html_tree(html: str):
+    """Parse the page with lxml, or return None when lxml is unavailable."""
+    if _etree is None:
+        return None
+    try:
+        return _etree.fromstring(html, _HTML_PARSER)
+    except Exception:
+        return None
+
+
+def extract_og_metadata(html: str, tree=None) -> Dict[str, str]:
     """Extract Open Graph metadata from HTML."""
     data = {}
-    og_fields = [
-        "og:title", "og:description", "og:image", "og:url",
-        "og:type", "twitter:creator", "twitter:image", "twitter:title"
-    ]
-    
-    for field in og_fields:
-        match = re.search(rf'{field}" content="([^"]+)"', html)
+
+    if tree is None:
+        tree = _parse_html_tree(html)
+
+    if tree is not None:
+        # One C tokenizer pass over the meta tags instead of 8 regex scans
+        for meta in tree.iter("meta"):
+            key = meta.get("property") or meta.get("name")
+            if key in _OG_FIELD_SET:
+                content = meta.get("content")
+                if content:
+                    data.setdefault(key.replace(":", "_"), content)
+        return data
+
+    for key, pattern in _OG_RES:
+        match = pattern.search(html)
         if match:
-            data[field.replace(":", "_")] = match.group(1)
-    
+            data[key] = match.group(1)
+
     return data
 
 
-def extract_page_metadata(html: str, username: str) -> Dict[str, Any]:
+def extract_page_metadata(html: str, username: str,
+                          keywords: Optional[set] = None,
+                          tree=None) -> Dict[str, Any]:
     """Extract additional metadata from page content."""
     data = {
         "has_display_name": False,
@@ -84,33 +304,34 @@ def extract_page_metadata(html: str, username: str) -> Dict[str, Any]:
     }
     
     try:
-        title_match = re.search(r"<title>([^<]+)</title>", html)
-        if title_match:
-            data["page_title"] = title_match.group(1)
-        
-        if 'verified' in html.lower() or '✓' in html:
+        if keywords is None:
+            keywords = _scan_keywords(html)
+
+        if tree is not None:
+            title_el = tree.find(".//title")
+            if title_el is not None and title_el.text:
+                data["page_title"] = title_el.text
+        else:
+            title_match = _TITLE_RE.search(html)
+            if title_match:
+                data["page_title"] = title_match.group(1)
+
+        if 'verified' in keywords or '✓' in html:
             data["is_verified"] = True
-        
-        display_name_pattern = r'"displayName"\s*:\s*"([^"]+)"'
-        match = re.search(display_name_pattern, html)
+
+        match = _DISPLAY_NAME_RE.search(html)
         if match:
             data["display_name"] = match.group(1)
             data["has_display_name"] = True
-        
-        bio_patterns = [
-            r'"description"\s*:\s*"([^"]+)"',
-            r'"bio"\s*:\s*"([^"]+)"',
-            r'<meta name="description" content="([^"]+)"'
-        ]
-        
-        for pattern in bio_patterns:
-            match = re.search(pattern, html)
+
+        for pattern in _PAGE_BIO_RES:
+            match = pattern.search(html)
             if match:
                 data["bio"] = match.group(1)
                 data["has_bio"] = True
                 break
         
-        if 'story' in html.lower():
+        if 'story' in keywords:
             data["has_story"] = True
         
     except Exception as e:
@@ -125,8 +346,7 @@ def extract_schema_data(html: str) -> Optional[List[Dict[str, Any]]]:
     Returns a list of parsed JSON objects (one per <script type="application/ld+json">).
     """
     try:
-        json_ld_pattern = r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>'
-        matches = re.findall(json_ld_pattern, html, re.DOTALL)
+        matches = _JSON_LD_RE.findall(html)
 
         if not matches:
             return None
@@ -134,7 +354,7 @@ def extract_schema_data(html: str) -> Optional[List[Dict[str, Any]]]:
         schema_data: List[Dict[str, Any]] = []
         for match in matches:
             try:
-                data = json.loads(match)
+                data = _json_loads(match)
                 # Some pages wrap JSON-LD in arrays
                 if isinstance(data, list):
                     for item in data:
@@ -142,7 +362,7 @@ def extract_schema_data(html: str) -> Optional[List[Dict[str, Any]]]:
                             schema_data.append(item)
                 elif isinstance(data, dict):
                     schema_data.append(data)
-            except json.JSONDecodeError:
+            except ValueError:
                 continue
 
         return schema_data or None
@@ -153,6 +373,43 @@ def extract_schema_data(html: str) -> Optional[List[Dict[str, Any]]]:
     return None
 
 
+# schema.org interactionStatistic @type -> metadata field it populates
+_INTERACTION_FIELD = {
+    "WatchAction": "watch_count",
+    "LikeAction": "like_count",
+    "CommentAction": "comment_count",
+}
+
+
+@dataclass(slots=True)
+class SpotlightVideo:
+    """One Spotlight VideoObject; slots keep the per-video footprint fixed."""
+
+    url: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    upload_date: Optional[str] = None
+    watch_count: Optional[int] = None
+    like_count: Optional[int] = None
+    comment_count: Optional[int] = None
+    top_comments: List[Dict[str, Any]] = dc_field(default_factory=list)
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """Return value if it is a dict, else an empty dict (JSON-LD shape guard)."""
+    return value if type(value) is dict else {}
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Normalize a JSON-LD field to a list: dicts are wrapped, non-containers dropped."""
+    if type(value) is list:
+        return value
+    if type(value) is dict:
+        return [value]
+    return []
+
+
 def extract_follower_count_from_schema(schema_data: Dict[str, Any]) -> Optional[int]:
     """Extract follower count from schema.org JSON-LD if present.
 
@@ -161,20 +418,10 @@ def extract_follower_count_from_schema(schema_data: Dict[str, Any]) -> Optional[
     """
     try:
         main_entity = schema_data.get("mainEntity") or schema_data
-        stats = main_entity.get("interactionStatistic")
-
-        if not stats:
-            return None
-
-        if isinstance(stats, dict):
-            stats = [stats]
 
-        for item in stats:
-            if not isinstance(item, dict):
-                continue
-
-            interaction = item.get("interactionType") or {}
-            interaction_type = interaction.get("@type") if isinstance(interaction, dict) else None
+        for item in _as_list(main_entity.get("interactionStatistic")):
+            item = _as_dict(item)
+            interaction_type = _as_dict(item.get("interactionType")).get("@type")
 
             if interaction_type == "FollowAction" and "userInteractionCount" in item:
                 try:
@@ -215,7 +462,56 @@ def fetch_user_api_data(username: str, headers: Dict[str, str]) -> Optional[Dict
     return None
 
 
-def extract_snapchat_profile_data(html: str, username: str) -> Dict[str, Any]:
+def _scan_keywords(html: str) -> set:
+    """Return the set of marker words present in the page (lowercased)."""
+    return {m.group(1).lower() for m in _KEYWORD_SCAN_RE.finditer(html)}
+
+
+def _scan_json_attrs(html: str) -> Dict[str, str]:
+    """Collect the first value seen for every known JSON profile attribute.
+
+    Single O(N) pass over the document; keys are lowercased so variants like
+    timezone/timeZone collapse onto one entry.
+    """
+    attrs: Dict[str, str] = {}
+    for m in _JSON_ATTR_RE.finditer(html):
+        key = m.group("key").lower()
+        if key not in attrs:
+            attrs[key] = m.group("val") or m.group("num")
+    return attrs
+
+
+def _pick(attrs: Dict[str, str], *keys: str, check=None) -> Optional[str]:
+    """Return the first attribute present under any of the alias keys."""
+    for key in keys:
+        val = attrs.get(key)
+        if val is not None and (check is None or check(val)):
+            return val
+    return None
+
+
+def _next_data_profile(html: str) -> Optional[Dict[str, Any]]:
+    """Return the userProfile dict embedded in __NEXT_DATA__, if present.
+
+    Snapchat renders profiles through Next.js, so the authoritative fields
+    usually sit in this one JSON blob; parsing it once beats regexing the
+    rendered markup for each field.
+    """
+    m = _NEXT_DATA_RE.search(html)
+    if not m:
+        return None
+    try:
+        data = _json_loads(m.group(1))
+    except ValueError:
+        return None
+    props = data.get("props") if isinstance(data, dict) else None
+    page_props = props.get("pageProps") if isinstance(props, dict) else None
+    user = page_props.get("userProfile") if isinstance(page_props, dict) else None
+    return user if isinstance(user, dict) else None
+
+
+def extract_snapchat_profile_data(html: str, username: str,
+                                  keywords: Optional[set] = None) -> Dict[str, Any]:
     """Extract all Snapchat-specific profile data."""
     profile_data = {
         "username": username,
@@ -244,140 +540,95 @@ def extract_snapchat_profile_data(html: str, username: str) -> Dict[str, Any]:
     }
     
     try:
-        patterns = {
-            "display_name": [
-                r'"displayName"\s*:\s*"([^"]+)"',
-                r'"name"\s*:\s*"([^"]+)"',
-                r'<meta property="og:title" content="([^"]+)"'
-            ],
-            "bio": [
-                r'"bio"\s*:\s*"([^"]+)"',
-                r'"description"\s*:\s*"([^"]+)"',
-            ],
-            "profile_image_url": [
-                r'"image"\s*:\s*"([^"]+)"',
-                r'og:image" content="([^"]+)"'
-            ],
-            "website": [
-                r'"website"\s*:\s*"([^"]+)"',
-                r'"url"\s*:\s*"(https?://[^"]+)"'
-            ]
-        }
-        
-        for field, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                match = re.search(pattern, html, re.IGNORECASE)
-                if match:
-                    profile_data[field] = match.group(1)
-                    break
-        
-        # Extract location information
-        location_patterns = [
-            r'"location"\s*:\s*"([^"]+)"',
-            r'"city"\s*:\s*"([^"]+)"'
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                profile_data["location"] = match.group(1)
-                break
-        
-        # Extract postal code
-        postal_patterns = [
-            r'"postalCode"\s*:\s*"([^"]+)"',
-            r'"zipCode"\s*:\s*"([^"]+)"'
-        ]
-        for pattern in postal_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                profile_data["postal_code"] = match.group(1)
-                break
-        
-        # Extract birthday
-        birthday_patterns = [
-            r'"birthday"\s*:\s*"(\d{4}-\d{2}-\d{2})"',
-            r'"dob"\s*:\s*"(\d{4}-\d{2}-\d{2})"',
-            r'"dateOfBirth"\s*:\s*"(\d{1,2}/\d{1,2}/\d{4})"'
-        ]
-        for pattern in birthday_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        if keywords is None:
+            keywords = _scan_keywords(html)
+
+        # Fast path: lift fields straight out of the __NEXT_DATA__ blob
+        user = _next_data_profile(html)
+        if user:
+            info = user.get("publicProfileInfo")
+            if not isinstance(info, dict):
+                info = user
+            for src_key, dest_key in (("displayName", "display_name"),
+                                      ("bio", "bio"),
+                                      ("profilePictureUrl", "profile_image_url"),
+                                      ("snapcodeImageUrl", "profile_snapcode"),
+                                      ("websiteUrl", "website"),
+                                      ("address", "location")):
+                val = info.get(src_key)
+                if val and isinstance(val, str):
+                    profile_data[dest_key] = val
+            if info.get("badge") == 1:
+                profile_data["verified"] = True
+
+        attrs = _scan_json_attrs(html)
+
+        if profile_data["display_name"] is None:
+            profile_data["display_name"] = _pick(attrs, "displayname", "name")
+        if profile_data["display_name"] is None:
+            match = _OG_TITLE_META_RE.search(html)
             if match:
-                profile_data["birthday"] = match.group(1)
-                break
-        
-        # Extract age
-        age_patterns = [
-            r'"age"\s*:\s*(\d+)',
-            r'"years"\s*:\s*(\d+)',
-            r'"age"\s*:\s*"(\d+)"'
-        ]
-        for pattern in age_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+                profile_data["display_name"] = match.group(1)
+
+        if profile_data["bio"] is None:
+            profile_data["bio"] = _pick(attrs, "bio", "description")
+
+        if profile_data["profile_image_url"] is None:
+            profile_data["profile_image_url"] = _pick(attrs, "image")
+        if profile_data["profile_image_url"] is None:
+            match = _OG_IMAGE_META_RE.search(html)
             if match:
+                profile_data["profile_image_url"] = match.group(1)
+
+        if profile_data["website"] is None:
+            profile_data["website"] = _pick(attrs, "website") or _pick(
+                attrs, "url", check=lambda v: v.startswith(("http://", "https://")))
+
+        if profile_data["location"] is None:
+            profile_data["location"] = _pick(attrs, "location", "city")
+        profile_data["postal_code"] = _pick(attrs, "postalcode", "zipcode")
+
+        # Birthday: ISO dates under birthday/dob, slash dates under dateOfBirth
+        profile_data["birthday"] = (
+            _pick(attrs, "birthday", "dob", check=_ISO_DATE_RE.match)
+            or _pick(attrs, "dateofbirth", check=_SLASH_DATE_RE.match))
+
+        age = _pick(attrs, "age", "years", check=str.isdigit)
+        if age is not None:
+            profile_data["age"] = int(age)
+
+        profile_data["gender"] = _pick(
+            attrs, "gender", check=lambda v: v.lower() in _GENDER_VALUES)
+
+        profile_data["relationship_status"] = _pick(
+            attrs, "relationshipstatus", "relationship")
+
+        profile_data["phone"] = _pick(
+            attrs, "phone", "phonenumber", check=_PHONE_VAL_RE.match)
+
+        profile_data["email"] = _pick(
+            attrs, "email", "contactemail", check=_EMAIL_VAL_RE.match)
+
+        # Extract interests: the value is JSON, so decode it from the opening
+        # bracket instead of lazily regexing across the rest of the document
+        idx = html.find('"interests"')
+        if idx != -1:
+            bracket = html.find('[', idx)
+            if bracket != -1:
                 try:
-                    profile_data["age"] = int(match.group(1))
-                    break
+                    arr, _ = _JSON_DECODER.raw_decode(html, bracket)
+                    if isinstance(arr, list):
+                        interests = [i for i in arr if isinstance(i, str)]
+                        profile_data["interests"] = interests[:10]  # Top 10 interests
                 except ValueError:
-                    continue
-        
-        # Extract gender
-        gender_patterns = [
-            r'"gender"\s*:\s*"([MF])"',
-            r'"gender"\s*:\s*"(Male|Female|Other)"'
-        ]
-        for pattern in gender_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                profile_data["gender"] = match.group(1)
-                break
-        
-        # Extract relationship status
-        relationship_patterns = [
-            r'"relationshipStatus"\s*:\s*"([^"]+)"',
-            r'"relationship"\s*:\s*"([^"]+)"'
-        ]
-        for pattern in relationship_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                profile_data["relationship_status"] = match.group(1)
-                break
-        
-        # Extract phone
-        phone_patterns = [
-            r'"phone"\s*:\s*"([+\d\s\-().]+)"',
-            r'"phoneNumber"\s*:\s*"([+\d\s\-().]+)"'
-        ]
-        for pattern in phone_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                profile_data["phone"] = match.group(1)
-                break
-        
-        # Extract email
-        email_patterns = [
-            r'"email"\s*:\s*"([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})"',
-            r'"contactEmail"\s*:\s*"([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})"'
-        ]
-        for pattern in email_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                profile_data["email"] = match.group(1)
-                break
-        
-        # Extract interests
-        interests_pattern = r'"interests"\s*:\s*\[(.*?)\]'
-        match = re.search(interests_pattern, html, re.DOTALL)
-        if match:
-            interests_text = match.group(1)
-            interests = re.findall(r'"([^"]+)"', interests_text)
-            profile_data["interests"] = interests[:10]  # Top 10 interests
+                    pass
         
         # Extract verification status
-        if 'verified' in html.lower():
+        if 'verified' in keywords:
             profile_data["verified"] = True
-        
+
         # Extract ghost mode
-        if 'ghost' in html.lower() or 'ghostmode' in html.lower():
+        if 'ghost' in keywords or 'ghostmode' in keywords:
             profile_data["ghostmode_enabled"] = True
         
         # NOTE: We intentionally do NOT infer user country or language
@@ -387,23 +638,16 @@ def extract_snapchat_profile_data(html: str, username: str) -> Dict[str, Any]:
         # misleading OSINT signals.
 
         # Extract timezone only when explicitly present as a profile attribute
-        timezone_patterns = [
-            r'"timezone"\s*:\s*"([^"]+)"',
-            r'"timeZone"\s*:\s*"([^"]+)"'
-        ]
-        for pattern in timezone_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                profile_data["timezone"] = match.group(1)
-                break
-        
+        profile_data["timezone"] = _pick(attrs, "timezone")
+
     except Exception as e:
         logging.warning("Error extracting profile data: %s", e)
     
     return profile_data
 
 
-def extract_snapchat_account_details(html: str, username: str) -> Dict[str, Any]:
+def extract_snapchat_account_details(html: str, username: str,
+                                     keywords: Optional[set] = None) -> Dict[str, Any]:
     """Extract detailed Snapchat account information."""
     account_details = {
         "account_type": None,
@@ -417,52 +661,38 @@ def extract_snapchat_account_details(html: str, username: str) -> Dict[str, Any]
     }
     
     try:
+        if keywords is None:
+            keywords = _scan_keywords(html)
+
+        attrs = _scan_json_attrs(html)
+
         # Extract user ID
-        user_id_patterns = [
-            r'"userId"\s*:\s*"([^"]+)"',
-            r'"id"\s*:\s*"([^"]+)"',
-            r'"uniqueId"\s*:\s*"([^"]+)"'
-        ]
-        
-        for pattern in user_id_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                account_details["user_id"] = match.group(1)
-                break
-        
+        account_details["user_id"] = _pick(attrs, "userid", "id", "uniqueid")
+
         # Extract snap score
-        snap_score_pattern = r'"snapScore"\s*:\s*(\d+)'
-        match = re.search(snap_score_pattern, html)
-        if match:
-            account_details["snap_score"] = int(match.group(1))
+        snap_score = _pick(attrs, "snapscore", check=str.isdigit)
+        if snap_score is not None:
+            account_details["snap_score"] = int(snap_score)
         
         # Extract account type
-        if 'business' in html.lower():
+        if 'business' in keywords:
             account_details["account_type"] = "business"
-        elif 'verified' in html.lower():
+        elif 'verified' in keywords:
             account_details["account_type"] = "verified"
         else:
             account_details["account_type"] = "personal"
         
         # Extract created date
-        created_patterns = [
-            r'"createdDate"\s*:\s*"([^"]+)"',
-            r'"created"\s*:\s*"([^"]+)"',
-            r'"joined"\s*:\s*"(\d{4}-\d{2}-\d{2})"'
-        ]
-        
-        for pattern in created_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                account_details["created_date"] = match.group(1)
-                break
+        account_details["created_date"] = (
+            _pick(attrs, "createddate", "created")
+            or _pick(attrs, "joined", check=_ISO_DATE_RE.match))
         
         # Extract device type
-        if 'iOS' in html or 'iPhone' in html:
+        if 'ios' in keywords or 'iphone' in keywords:
             account_details["device_type"] = "iOS"
-        elif 'Android' in html:
+        elif 'android' in keywords:
             account_details["device_type"] = "Android"
-        elif 'Web' in html or 'web' in html.lower():
+        elif 'web' in keywords:
             account_details["device_type"] = "Web"
         
     except Exception as e:
@@ -476,23 +706,9 @@ def extract_user_counts(html: str) -> Dict[str, Any]:
     data = {}
     
     try:
-        count_patterns = {
-            "follower_count": [
-                r'"followers"\s*:\s*(\d+)',
-                r'>(\d+)\s*followers?<'
-            ],
-            "following_count": [
-                r'"following"\s*:\s*(\d+)',
-                r'>(\d+)\s*following<'
-            ],
-            "friend_count": [
-                r'"friends"\s*:\s*(\d+)'
-            ]
-        }
-        
-        for field, patterns in count_patterns.items():
+        for field, patterns in _COUNT_RES.items():
             for pattern in patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
+                match = pattern.search(html)
                 if match:
                     try:
                         data[field] = int(match.group(1))
@@ -518,61 +734,46 @@ def extract_linked_accounts(html: str, username: str) -> Dict[str, Any]:
     
     try:
         # Extract user's phone
-        user_phone_patterns = [
-            r'"phoneNumber"\s*:\s*"([+\d\s\-().]+)"',
-            r'"phone"\s*:\s*"([+\d\s\-().]+)"',
-            r'"userPhone"\s*:\s*"([+\d\s\-().]+)"'
-        ]
-        
-        for pattern in user_phone_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _USER_PHONE_RES:
+            match = pattern.search(html)
             if match:
                 phone = match.group(1).strip()
-                if phone and len(re.sub(r'\D', '', phone)) >= 10:
+                if phone and len(phone.translate(_NON_DIGIT_TBL)) >= 10:
                     data["user_phone"] = phone
                     data["phones"].append(phone)
                     break
-        
+
         # Extract user's email
-        user_email_patterns = [
-            r'"email"\s*:\s*"([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})"',
-            r'"userEmail"\s*:\s*"([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})"'
-        ]
-        
-        for pattern in user_email_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _USER_EMAIL_RES:
+            match = pattern.search(html)
             if match:
                 email = match.group(1).strip()
                 data["user_email"] = email
                 data["emails"].append(email)
                 break
-        
+
         # Extract linked social accounts
-        social_patterns = {
-            "instagram": [r'instagram\.com/([a-zA-Z0-9_.]+)', r'"instagram"\s*:\s*"([^"]+)"'],
-            "twitter": [r'twitter\.com/([a-zA-Z0-9_]+)', r'"twitter"\s*:\s*"([^"]+)"'],
-            "facebook": [r'facebook\.com/([a-zA-Z0-9.]+)', r'"facebook"\s*:\s*"([^"]+)"'],
-            "tiktok": [r'tiktok\.com/@([a-zA-Z0-9_]+)', r'"tiktok"\s*:\s*"([^"]+)"'],
-            "youtube": [r'youtube\.com/([a-zA-Z0-9_-]+)', r'"youtube"\s*:\s*"([^"]+)"']
-        }
-        
-        for platform, patterns in social_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE)
-                for match in matches:
-                    handle = match if isinstance(match, str) else match[0] if match else None
-                    if handle:
-                        account = {
-                            "platform": platform,
-                            "handle": handle,
-                            "url": f"https://{platform}.com/{'' if platform == 'tiktok' else ''}{handle}"
-                        }
-                        if not any(a["handle"] == handle for a in data["accounts"]):
-                            data["accounts"].append(account)
+        handles_seen = set()
+
+        def _add_account(platform, handle):
+            if handle and (platform, handle) not in handles_seen:
+                handles_seen.add((platform, handle))
+                data["accounts"].append({
+                    "platform": platform,
+                    "handle": handle,
+                    "url": f"https://{platform}.com/{'' if platform == 'tiktok' else ''}{handle}"
+                })
+
+        for m in _SOCIAL_URL_RE.finditer(html):
+            _add_account(m.group(1).lower(), m.group(2))
+
+        for platform, pattern in _SOCIAL_JSON_RES:
+            for handle in pattern.findall(html):
+                _add_account(platform, handle)
         
-        # Remove duplicates
-        data["phones"] = list(set(data["phones"]))
-        data["emails"] = list(set(data["emails"]))
+        # Remove duplicates, keeping first-seen order
+        data["phones"] = list(dict.fromkeys(data["phones"]))
+        data["emails"] = list(dict.fromkeys(data["emails"]))
         
     except Exception as e:
         logging.warning("Error extracting linked accounts: %s", e)
@@ -585,58 +786,37 @@ def extract_contact_from_bio(html: str, username: str) -> List[Dict[str, str]]:
     contact_info = []
     
     try:
-        bio_patterns = [
-            r'"bio"\s*:\s*"([^"]+)"',
-            r'"description"\s*:\s*"([^"]+)"'
-        ]
-        
         bio_text = ""
-        for pattern in bio_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _BIO_RES:
+            match = pattern.search(html)
             if match:
                 bio_text = match.group(1)
                 break
-        
+
         if not bio_text:
             return contact_info
-        
-        # Extract phone numbers from various formats
-        phone_patterns = [
-            # International format: +1234567890, +92-300-1234567
-            (r'\+?[\d\s\-().]{10,}', 'international'),
-            # US format: (123) 456-7890, 123-456-7890
-            (r'(?:\+?1[-.\s]?)?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})', 'us'),
-            # Pakistan format: 03001234567, +923001234567
-            (r'(?:\+92|0)?3\d{2}[-.\s]?\d{7}', 'pakistan'),
-            # Generic: Call/Contact/Phone followed by number
-            (r'(?:Call|Contact|Phone|Tel|Mobile|WhatsApp)\s*[:=]?\s*([+\d\s\-().]+)', 'labeled')
-        ]
-        
-        for pattern, phone_type in phone_patterns:
-            matches = re.findall(pattern, bio_text)
+
+        # Extract phone numbers from various formats, deduped on digits only
+        seen_digits = set()
+        for pattern, phone_type in _BIO_PHONE_RES:
+            matches = pattern.findall(bio_text)
             for match in matches:
                 phone = match if isinstance(match, str) else '-'.join([m for m in match if m])
-                if phone and len(re.sub(r'\D', '', phone)) >= 10:
-                    # Avoid duplicates
-                    phone_clean = re.sub(r'\D', '', phone)
-                    if not any(re.sub(r'\D', '', c['value']) == phone_clean for c in contact_info if c.get('type') == 'phone'):
-                        contact_info.append({
-                            "type": "phone",
-                            "value": phone.strip(),
-                            "source": "bio",
-                            "format": phone_type
-                        })
-        
+                if not phone:
+                    continue
+                phone_clean = phone.translate(_NON_DIGIT_TBL)
+                if len(phone_clean) >= 10 and phone_clean not in seen_digits:
+                    seen_digits.add(phone_clean)
+                    contact_info.append({
+                        "type": "phone",
+                        "value": phone.strip(),
+                        "source": "bio",
+                        "format": phone_type
+                    })
+
         # Extract WhatsApp numbers
-        whatsapp_patterns = [
-            r'wa\.me/(\d+)',
-            r'whatsapp\.com/send\?phone=(\d+)',
-            r'(?:WhatsApp|wa)[\s:]*(\d+)',
-            r'chat\.whatsapp\.com/([A-Za-z0-9_-]+)'
-        ]
-        
-        for pattern in whatsapp_patterns:
-            matches = re.findall(pattern, bio_text, re.IGNORECASE)
+        for pattern in _WHATSAPP_RES:
+            matches = pattern.findall(bio_text)
             for match in matches:
                 contact_info.append({
                     "type": "whatsapp",
@@ -646,14 +826,8 @@ def extract_contact_from_bio(html: str, username: str) -> List[Dict[str, str]]:
                 })
         
         # Extract Telegram handles
-        telegram_patterns = [
-            r't\.me/([a-zA-Z0-9_]+)',
-            r'telegram\.me/([a-zA-Z0-9_]+)',
-            r'(?:Telegram|TG)[\s:]*(@?[a-zA-Z0-9_]+)'
-        ]
-        
-        for pattern in telegram_patterns:
-            matches = re.findall(pattern, bio_text, re.IGNORECASE)
+        for pattern in _TELEGRAM_RES:
+            matches = pattern.findall(bio_text)
             for match in matches:
                 contact_info.append({
                     "type": "telegram",
@@ -663,8 +837,7 @@ def extract_contact_from_bio(html: str, username: str) -> List[Dict[str, str]]:
                 })
         
         # Extract emails
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, bio_text)
+        emails = _EMAIL_RE.findall(bio_text)
         for email in emails:
             contact_info.append({
                 "type": "email",
@@ -673,8 +846,7 @@ def extract_contact_from_bio(html: str, username: str) -> List[Dict[str, str]]:
             })
         
         # Extract URLs
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, bio_text)
+        urls = _URL_RE.findall(bio_text)
         for url in urls:
             contact_info.append({
                 "type": "website",
@@ -693,27 +865,18 @@ def extract_activity_info(html: str) -> Dict[str, Any]:
     data = {
         "last_seen": None,
         "account_created": None,
-        "last_updated": dt.datetime.utcnow().isoformat()
+        "last_updated": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
     }
     
     try:
-        last_seen_patterns = [
-            r'last\s+(?:seen|active)["\']?\s*:\s*["\']?([^"\'<>]+)',
-        ]
-        
-        for pattern in last_seen_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _LAST_SEEN_RES:
+            match = pattern.search(html)
             if match:
                 data["last_seen"] = match.group(1)
                 break
-        
-        creation_patterns = [
-            r'joined["\']?\s*:\s*["\']?([^"\'<>]+)',
-            r'created["\']?\s*:\s*["\']?(\d{4}-\d{2}-\d{2})'
-        ]
-        
-        for pattern in creation_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+
+        for pattern in _CREATION_RES:
+            match = pattern.search(html)
             if match:
                 data["account_created"] = match.group(1)
                 break
@@ -758,8 +921,8 @@ def fetch_user_stories(username: str) -> Tuple[List[str], Dict[str, Any]]:
     
     normalized = username.strip().lstrip("@").lower()
     
-    headers = DEFAULT_HEADERS.copy()
-    headers["Referer"] = "https://www.snapchat.com"
+    # DEFAULT_HEADERS ride on the session; only the Referer is per-call
+    headers = {"Referer": "https://www.snapchat.com"}
     
     user_metadata = {
         "username": normalized,
@@ -772,15 +935,33 @@ def fetch_user_stories(username: str) -> Tuple[List[str], Dict[str, Any]]:
     }
     
     try:
+        # The profile page and the two API endpoints are independent; overlap
+        # their round-trips instead of paying the latencies sequentially.
         profile_url = f"https://www.snapchat.com/add/{normalized}"
-        response = SESSION.get(profile_url, headers=headers, timeout=10)
-        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            profile_future = pool.submit(SESSION.get, profile_url, headers=headers, timeout=10)
+            api_data_future = pool.submit(fetch_user_api_data, normalized, headers)
+            api_stories_future = pool.submit(fetch_stories_from_api, normalized, headers)
+            response = profile_future.result()
+
         if response.status_code == 200:
-            html = response.text
-            
+            body = response.content
+
+            # Real profile pages run to hundreds of KB; a tiny body is a
+            # "not found" shell and not worth the full extractor pipeline
+            if len(body) < 4096 or b"Page Not Found" in body:
+                logging.info("Placeholder page for %s (%d bytes); skipping extraction",
+                             normalized, len(body))
+                return [], user_metadata
+
+            # Decode directly from the declared charset; response.text can
+            # fall back to whole-body charset detection on large pages
+            html = body.decode(response.encoding or "utf-8", errors="replace")
+            keywords = _scan_keywords(html)
+
             # Extract all profile data
-            user_metadata["profile_info"] = extract_snapchat_profile_data(html, normalized)
-            user_metadata["account_details"] = extract_snapchat_account_details(html, normalized)
+            user_metadata["profile_info"] = extract_snapchat_profile_data(html, normalized, keywords)
+            user_metadata["account_details"] = extract_snapchat_account_details(html, normalized, keywords)
 
             # Derive follower_count and enrich OSINT from schema.org JSON-LD when available
             schema_blocks = extract_schema_data(html)
@@ -803,8 +984,8 @@ def fetch_user_stories(username: str) -> Tuple[List[str], Dict[str, Any]]:
                             user_metadata["account_details"]["follower_count"] = follower_from_schema
 
                     # Use schema.org mainEntity for selected OSINT fields
-                    main_entity = profile_block.get("mainEntity", {}) if isinstance(profile_block, dict) else {}
-                    address = main_entity.get("address") if isinstance(main_entity, dict) else None
+                    main_entity = _as_dict(profile_block.get("mainEntity"))
+                    address = main_entity.get("address")
 
                     # We treat address as a descriptive location only if
                     # Snapchat exposes it explicitly on the profile. We still
@@ -815,103 +996,82 @@ def fetch_user_stories(username: str) -> Tuple[List[str], Dict[str, Any]]:
                             user_metadata["profile_info"]["location"] = address
 
                     # External sites (e.g., official website) from sameAs
-                    same_as = main_entity.get("sameAs") if isinstance(main_entity, dict) else None
+                    same_as = main_entity.get("sameAs")
                     if isinstance(same_as, list) and same_as:
                         user_metadata["external_sites"] = same_as
 
                 # Spotlight / video OSINT from VideoObject blocks
                 spotlight_videos: List[Dict[str, Any]] = []
                 spotlight_keywords: set = set()
+                # Local-name bindings for the loops below; saves a LOAD_ATTR
+                # per iteration across videos, keywords and comments.
+                _interaction_field = _INTERACTION_FIELD.get
+                _vid_append = spotlight_videos.append
+                _kw_add = spotlight_keywords.add
 
                 for block in schema_blocks:
                     if not isinstance(block, dict) or block.get("@type") != "VideoObject":
                         continue
 
-                    video: Dict[str, Any] = {}
-                    video["url"] = block.get("url") or block.get("contentUrl")
-                    video["title"] = block.get("name")
-                    video["description"] = block.get("description")
-                    video["thumbnail_url"] = block.get("thumbnailUrl")
-                    video["upload_date"] = block.get("uploadDate")
+                    video = SpotlightVideo(
+                        url=block.get("url") or block.get("contentUrl"),
+                        title=block.get("name"),
+                        description=block.get("description"),
+                        thumbnail_url=block.get("thumbnailUrl"),
+                        upload_date=block.get("uploadDate"),
+                    )
 
                     # Interaction statistics (views, likes, comments)
-                    watch_count = None
-                    like_count = None
-                    comment_count = None
-
-                    stats = block.get("interactionStatistic")
-                    if isinstance(stats, dict):
-                        stats = [stats]
-                    if isinstance(stats, list):
-                        for item in stats:
-                            if not isinstance(item, dict):
-                                continue
-                            interaction = item.get("interactionType") or {}
-                            interaction_type = interaction.get("@type") if isinstance(interaction, dict) else None
-                            count = item.get("userInteractionCount")
-                            try:
-                                count_int = int(count) if count is not None else None
-                            except (TypeError, ValueError):
-                                count_int = None
-
-                            if interaction_type == "WatchAction":
-                                watch_count = count_int
-                            elif interaction_type == "LikeAction":
-                                like_count = count_int
-                            elif interaction_type == "CommentAction":
-                                comment_count = count_int
-
-                    video["watch_count"] = watch_count
-                    video["like_count"] = like_count
-                    video["comment_count"] = comment_count
+                    for item in _as_list(block.get("interactionStatistic")):
+                        item = _as_dict(item)
+                        field = _interaction_field(_as_dict(item.get("interactionType")).get("@type"))
+                        if field is None:
+                            continue
+                        count = item.get("userInteractionCount")
+                        try:
+                            setattr(video, field, int(count) if count is not None else None)
+                        except (TypeError, ValueError):
+                            setattr(video, field, None)
 
                     # Top-level keywords (interests / topics)
-                    keywords = block.get("keywords")
-                    if isinstance(keywords, list):
-                        for kw in keywords:
-                            if isinstance(kw, str):
-                                spotlight_keywords.add(kw)
+                    for kw in _as_list(block.get("keywords")):
+                        if isinstance(kw, str):
+                            _kw_add(kw)
 
                     # Sample top comments (limited for size)
                     comments_data = []
-                    comments = block.get("comment")
-                    if isinstance(comments, dict):
-                        comments = [comments]
-                    if isinstance(comments, list):
-                        for comment in comments[:10]:
-                            if not isinstance(comment, dict):
-                                continue
-                            author = comment.get("author") or {}
-                            if not isinstance(author, dict):
-                                author = {}
-                            interaction = comment.get("interactionStatistic") or {}
-                            if isinstance(interaction, dict):
-                                interaction = [interaction]
-                            like_count_comment = None
-                            if isinstance(interaction, list):
-                                for it in interaction:
-                                    if not isinstance(it, dict):
-                                        continue
-                                    it_type = it.get("interactionType") or {}
-                                    it_type_name = it_type.get("@type") if isinstance(it_type, dict) else None
-                                    if it_type_name == "LikeAction" and "userInteractionCount" in it:
-                                        try:
-                                            like_count_comment = int(it["userInteractionCount"])
-                                        except (TypeError, ValueError):
-                                            like_count_comment = None
-                            comments_data.append(
-                                {
-                                    "text": comment.get("text"),
-                                    "author_name": author.get("name"),
-                                    "date_published": comment.get("datePublished"),
-                                    "like_count": like_count_comment,
-                                }
-                            )
-
-                    if comments_data:
-                        video["top_comments"] = comments_data
-
-                    spotlight_videos.append(video)
+                    _comment_append = comments_data.append
+                    for comment in islice(_as_list(block.get("comment")), 10):
+                        comment = _as_dict(comment)
+                        if not comment:
+                            continue
+                        author = _as_dict(comment.get("author"))
+                        like_count_comment = None
+                        for it in _as_list(comment.get("interactionStatistic")):
+                            it = _as_dict(it)
+                            it_type_name = _as_dict(it.get("interactionType")).get("@type")
+                            if it_type_name == "LikeAction" and "userInteractionCount" in it:
+                                try:
+                                    like_count_comment = int(it["userInteractionCount"])
+                                except (TypeError, ValueError):
+                                    like_count_comment = None
+                        _comment_append(
+                            {
+                                "text": comment.get("text"),
+                                "author_name": author.get("name"),
+                                "date_published": comment.get("datePublished"),
+                                "like_count": like_count_comment,
+                            }
+                        )
+
+                    video.top_comments = comments_data
+
+                    # Serialize at the boundary; omit top_comments when empty to
+                    # keep the output shape unchanged.
+                    video_dict = asdict(video)
+                    if not video_dict["top_comments"]:
+                        del video_dict["top_comments"]
+                    _vid_append(video_dict)
 
                 if spotlight_videos:
                     user_metadata["spotlight_videos"] = spotlight_videos
@@ -919,10 +1079,14 @@ def fetch_user_stories(username: str) -> Tuple[List[str], Dict[str, Any]]:
                     # Use spotlight keywords to enrich profile interests
                     if isinstance(user_metadata["profile_info"], dict) and spotlight_keywords:
                         existing_interests = user_metadata["profile_info"].get("interests") or []
-                        # Preserve original casing but avoid duplicates (case-insensitive)
-                        existing_lower = {str(v).lower() for v in existing_interests}
+                        # Preserve original casing but avoid duplicates (case-insensitive);
+                        # the dict keeps one lowercase lookup per keyword. Spotlight
+                        # keywords stay sorted so output order is deterministic.
+                        seen = {v.lower(): v for v in existing_interests if isinstance(v, str)}
                         for kw in sorted(spotlight_keywords):
-                            if kw.lower() not in existing_lower:
+                            key = kw.lower()
+                            if key not in seen:
+                                seen[key] = kw
                                 existing_interests.append(kw)
                         user_metadata["profile_info"]["interests"] = existing_interests
 
@@ -951,8 +1115,26 @@ def fetch_user_stories(username: str) -> Tuple[List[str], Dict[str, Any]]:
             
             contact_from_bio = extract_contact_from_bio(html, normalized)
             user_metadata["contact_from_bio"] = contact_from_bio
-            
-            user_metadata["is_public"] = "public" in html.lower() or "private" not in html.lower()
+
+            # Attach whatever the API endpoints returned (fetched above in
+            # parallel with the profile page; both swallow their own errors)
+            api_data = api_data_future.result()
+            if api_data:
+                user_metadata["api_data"] = api_data
+            api_stories = api_stories_future.result()
+            if api_stories:
+                user_metadata["api_stories"] = api_stories
+
+            # Same predicate as the old substring checks — public anywhere,
+            # or no private anywhere — stopping early on the first public hit.
+            has_public = False
+            saw_private = False
+            for m in _PUBPRIV_RE.finditer(body):
+                if m.group(1).lower() == b"public":
+                    has_public = True
+                    break
+                saw_private = True
+            user_metadata["is_public"] = has_public or not saw_private
             
             logging.info("Retrieved complete profile data for: %s", normalized)
         
@@ -963,13 +1145,40 @@ def fetch_user_stories(username: str) -> Tuple[List[str], Dict[str, Any]]:
         return [], user_metadata
 
 
+async def fetch_many(usernames: List[str], concurrency: int = 16) -> Dict[str, Dict[str, Any]]:
+    """Fetch several user profiles concurrently.
+
+    The per-user pipeline is blocking requests code, so each username runs in
+    a worker thread via asyncio.to_thread, gated by a semaphore so in-flight
+    fetches stay within the session's connection pool. Returns a mapping of
+    normalized username -> user metadata; failed users are logged and omitted.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(username: str):
+        async with sem:
+            _, metadata = await asyncio.to_thread(fetch_user_stories, username)
+            return metadata
+
+    results = await asyncio.gather(*(_one(u) for u in usernames),
+                                   return_exceptions=True)
+
+    out: Dict[str, Dict[str, Any]] = {}
+    for username, result in zip(usernames, results):
+        if isinstance(result, BaseException):
+            logging.error("Batch fetch failed for %s: %s", username, result)
+            continue
+        out[result.get("username", username)] = result
+    return out
+
+
 def search_snapchat_user(username: str) -> Optional[Dict[str, Any]]:
     """Search for a Snapchat user by username."""
     logging.info("Searching for Snapchat user: %s", username)
     
     normalized = username.strip().lstrip("@").lower()
-    headers = DEFAULT_HEADERS.copy()
-    headers["Referer"] = "https://www.snapchat.com"
+    # DEFAULT_HEADERS ride on the session; only the Referer is per-call
+    headers = {"Referer": "https://www.snapchat.com"}
     
     try:
         user_url = f"https://www.snapchat.com/add/{normalized}"
@@ -978,22 +1187,23 @@ def search_snapchat_user(username: str) -> Optional[Dict[str, Any]]:
         if response.status_code == 200:
             logging.info("Found user profile: %s", user_url)
             
-            html_content = response.text
+            html_content = response.content.decode(response.encoding or "utf-8", errors="replace")
             
             user_data = {
                 "username": normalized,
                 "original_input": username,
                 "profile_url": user_url,
                 "found": True,
-                "timestamp": dt.datetime.utcnow().isoformat(),
+                "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
                 "http_status": response.status_code
             }
             
-            # Extract metadata
-            og_data = extract_og_metadata(html_content)
+            # Extract metadata, sharing a single parsed tree across extractors
+            tree = _parse_html_tree(html_content)
+            og_data = extract_og_metadata(html_content, tree)
             user_data.update(og_data)
-            
-            extra_data = extract_page_metadata(html_content, normalized)
+
+            extra_data = extract_page_metadata(html_content, normalized, tree=tree)
             user_data.update(extra_data)
             
             schema_blocks = extract_schema_data(html_content)
@@ -1020,7 +1230,7 @@ def scrape_snapchat_user(username: str, output_dir: Optional[str] = None) -> Dic
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    timestamp = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d_%H%M%S")
     normalized_username = username.strip().lstrip("@").lower()
     
     results = {
@@ -1052,8 +1262,7 @@ def scrape_snapchat_user(username: str, output_dir: Optional[str] = None) -> Dic
     output_file = output_path / f"snapchat_{normalized_username}_{timestamp}.json"
     
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(_dump_json_bytes(results))
         logging.info("Results saved to: %s", output_file)
         results["output_file"] = str(output_file)
     except OSError as e:
@@ -1119,20 +1328,27 @@ def main():
     parser.add_argument("--user", "-u", default=None, help="Snapchat username or full name")
     parser.add_argument("--output", "-o", default=None, help=f"Output directory (default: {DEFAULT_OUTPUT_DIR})")
     parser.add_argument("--log-dir", default=None, help="Directory for log files")
-    
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk HTTP response cache")
+
     args = parser.parse_args()
-    
+
     # Setup logging
     setup_logging(args.log_dir)
+
+    if args.no_cache:
+        global SESSION
+        SESSION = _make_session(cached=False)
     
     if args.user:
         logging.info("Running in USER mode")
         results = scrape_snapchat_user(args.user, args.output)
         
-        # Output with UTF-8 encoding
-        output = json.dumps(results, indent=2, ensure_ascii=False)
-        sys.stdout.reconfigure(encoding='utf-8')
-        print(output)
+        # Emit UTF-8 bytes straight to the binary layer; routing the
+        # multi-MB payload through print() would re-encode it from str
+        sys.stdout.buffer.write(_dump_json_bytes(results))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
         
         if results.get("errors"):
             sys.exit(1)
@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import datetime as dt
 import json
 import logging
@@ -6,11 +7,31 @@ import os
 import random
 from typing import Any, Dict, List
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # fast serializer for the result payloads; stdlib json works too
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # on-disk HTTP cache; plain session when unavailable
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
 
 API_BASE = "https://api.stackexchange.com/2.3"
 SITE = "stackoverflow"
 
+# Optional pre-registered Stack Exchange filter id restricting responses to
+# the fields normalize_user actually keeps (filters must be minted once via
+# GET /2.3/filters/create and are stable afterwards). When set, response
+# bodies shrink severalfold and json parsing drops proportionally; unset, the
+# API default is used.
+MINIMAL_FILTER = os.environ.get("SHADOWHORN_SO_FILTER", "")
+
 # Rotate User-Agent on each request from a small pool
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0 Safari/537.36",
@@ -19,6 +40,36 @@ USER_AGENTS = [
 ]
 
 
+# Shared pooled session: every request hits api.stackexchange.com, so
+# reusing one TLS connection avoids a fresh handshake per call. Retry
+# backs off automatically on rate limiting and transient 5xx. When
+# requests-cache is installed, 200 responses persist on disk for an hour
+# so repeat lookups of the same target skip the network (and the API
+# quota) entirely; the cache key is built from URL + params, so the
+# rotating User-Agent does not fragment it.
+def _make_session(cached: bool = True) -> requests.Session:
+    if cached and CachedSession is not None:
+        session = CachedSession(
+            ".osint_http_cache",
+            backend="sqlite",
+            expire_after=3600,
+            allowable_codes=(200,),
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _make_session()
+
+
 def _random_headers() -> Dict[str, str]:
     return {
         "User-Agent": random.choice(USER_AGENTS),
@@ -56,9 +107,11 @@ def search_users(display_name: str, max_results: int = 10) -> List[Dict[str, Any
         "site": SITE,
         "pagesize": max_results,
     }
+    if MINIMAL_FILTER:
+        params["filter"] = MINIMAL_FILTER
 
     logging.info("Querying Stack Overflow users: %s", display_name)
-    resp = requests.get(url, params=params, timeout=15, headers=_random_headers())
+    resp = SESSION.get(url, params=params, timeout=15, headers=_random_headers())
     resp.raise_for_status()
 
     data = resp.json()
@@ -74,23 +127,78 @@ def fetch_top_tags(user_id: int, max_tags: int = 10) -> List[Dict[str, Any]]:
         "site": SITE,
         "pagesize": max_tags,
     }
+    if MINIMAL_FILTER:
+        params["filter"] = MINIMAL_FILTER
 
     logging.info("Fetching top tags for user_id=%s", user_id)
-    resp = requests.get(url, params=params, timeout=15, headers=_random_headers())
+    resp = SESSION.get(url, params=params, timeout=15, headers=_random_headers())
     resp.raise_for_status()
     data = resp.json()
     return data.get("items", [])
 
 
-def enrich_users_with_tags(users: List[Dict[str, Any]], max_tags: int = 10) -> None:
-    for user in users:
-        uid = user.get("user_id")
-        if not uid:
+# The Stack Exchange vector endpoints accept up to 100 semicolon-joined ids
+# per call; pagesize is likewise capped at 100 items per page.
+_TAGS_PAGE_SIZE = 100
+# Safety bound when following has_more so one prolific batch cannot drain
+# the API quota.
+_TAGS_MAX_PAGES = 5
+
+
+async def _fetch_tags_batch_async(session: "aiohttp.ClientSession", sem: asyncio.Semaphore,
+                                  user_ids: List[int]) -> List[Dict[str, Any]]:
+    ids = ";".join(str(uid) for uid in user_ids)
+    items: List[Dict[str, Any]] = []
+    async with sem:
+        for page in range(1, _TAGS_MAX_PAGES + 1):
+            params = {"site": SITE, "pagesize": _TAGS_PAGE_SIZE, "page": page}
+            if MINIMAL_FILTER:
+                params["filter"] = MINIMAL_FILTER
+            async with session.get(f"{API_BASE}/users/{ids}/top-tags",
+                                   params=params, headers=_random_headers()) as resp:
+                resp.raise_for_status()
+                data = await resp.json()
+            items.extend(data.get("items", []))
+            if not data.get("has_more"):
+                break
+    return items
+
+
+async def _enrich_users_with_tags_async(users: List[Dict[str, Any]], max_tags: int = 10) -> None:
+    targets = [u for u in users if u.get("user_id")]
+    if not targets:
+        return
+
+    # Size batches so a single 100-item page can hold max_tags entries for
+    # every user in the batch; has_more paging above catches the remainder
+    # when one user's tag list crowds out the others. The semaphore keeps
+    # multi-batch runs polite with respect to Stack Exchange rate limits.
+    ids = [u["user_id"] for u in targets]
+    batch_size = max(1, _TAGS_PAGE_SIZE // max(1, max_tags))
+    batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+    sem = asyncio.Semaphore(5)
+    timeout = aiohttp.ClientTimeout(total=15)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        results = await asyncio.gather(
+            *(_fetch_tags_batch_async(session, sem, batch) for batch in batches),
+            return_exceptions=True)
+
+    tags_by_uid: Dict[int, List[Dict[str, Any]]] = {}
+    for batch, result in zip(batches, results):
+        if isinstance(result, BaseException):
+            logging.warning("Failed to fetch tags for user_ids=%s: %s", batch, result)
             continue
-        try:
-            user["top_tags"] = fetch_top_tags(uid, max_tags=max_tags)
-        except requests.RequestException as exc:
-            logging.warning("Failed to fetch tags for user_id=%s: %s", uid, exc)
+        for item in result:
+            tags_by_uid.setdefault(item.get("user_id"), []).append(item)
+
+    for user in targets:
+        tags = tags_by_uid.get(user["user_id"])
+        if tags is not None:
+            user["top_tags"] = tags[:max_tags]
+
+
+def enrich_users_with_tags(users: List[Dict[str, Any]], max_tags: int = 10) -> None:
+    asyncio.run(_enrich_users_with_tags_async(users, max_tags=max_tags))
 
 
 def summarize_collectives(user: Dict[str, Any], max_tags: int = 5) -> List[Dict[str, Any]]:
@@ -151,14 +259,23 @@ def normalize_user(user: Dict[str, Any], max_collective_tags: int = 5) -> Dict[s
     }
 
 
-def save_results(username: str, results: List[Dict[str, Any]], output_dir: str) -> str:
+def _dump_json_bytes(data: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def save_results(username: str, results: List[Dict[str, Any]], output_dir: str,
+                 pretty: bool = False) -> str:
     os.makedirs(output_dir, exist_ok=True)
     timestamp = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     safe_username = username.replace("/", "_").replace("\\", "_")
     out_path = os.path.join(output_dir, f"stackoverflow_{safe_username}_{timestamp}.json")
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump({"query": username, "results": results}, f, indent=2, ensure_ascii=False)
+    with open(out_path, "wb") as f:
+        f.write(_dump_json_bytes({"query": username, "results": results}, pretty=pretty))
 
     logging.info("Saved results to %s", out_path)
     return out_path
@@ -229,10 +346,19 @@ def cli() -> None:
         default=5,
         help="Maximum number of tags to keep per collective (default: 5)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP cache and always hit the API",
+    )
 
     args = parser.parse_args()
     setup_logging(args.log_dir)
 
+    if args.no_cache:
+        global SESSION
+        SESSION = _make_session(cached=False)
+
     try:
         users = search_users(args.username, max_results=args.max_users)
         enrich_users_with_tags(users, max_tags=args.max_tags)
@@ -243,7 +369,8 @@ def cli() -> None:
             for u in users
         ]
 
-        save_results(args.username, normalized, args.output_dir)
+        # Humans read the CLI output file; keep it indented there.
+        save_results(args.username, normalized, args.output_dir, pretty=True)
 
         # Short console summary
         for u in normalized:
@@ -4,12 +4,20 @@ Twitter OSINT Collector (Non-blocking, Flask-friendly)
 Saves results in osint_results folder with timestamped filenames
 """
 
+import asyncio
+import os
 import time
 import json
 import logging
 import requests
 from pathlib import Path
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # fast serializer for the result payloads; stdlib json works too
+    import orjson
+except ImportError:
+    orjson = None
 
 MAX_TWEETS = 50  # Number of recent tweets to fetch per user
 MAX_FOLLOWERS = 50
@@ -23,6 +31,23 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(mess
 OSINT_RESULTS_DIR = Path("osint_results")
 OSINT_RESULTS_DIR.mkdir(exist_ok=True)
 
+# -----------------------------
+# Shared HTTP session
+# -----------------------------
+# Every call targets api.twitter.com; a pooled session reuses the TLS
+# connection across the user/tweets/followers/following requests. Retry
+# covers transient 5xx; 429 still flows through safe_request so callers
+# get the wait_seconds hint from x-rate-limit-reset.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
 # -----------------------------
 # Auth + Request Helper
 # -----------------------------
@@ -33,7 +58,7 @@ def get_headers(token):
 def safe_request(url, token, params=None):
     """Perform API request. Returns data or wait_seconds if rate limited."""
     headers = get_headers(token)
-    resp = requests.get(url, headers=headers, params=params)
+    resp = SESSION.get(url, headers=headers, params=params)
 
     if resp.status_code == 200:
         return {"data": resp.json().get("data", [])}
@@ -87,10 +112,10 @@ def get_following(user_id, token, limit=MAX_FOLLOWING):
 # -----------------------------
 # MASTER AGGREGATOR
 # -----------------------------
-def collect_osint(username, token):
+async def _collect_osint_async(username, token):
     logging.info(f"Collecting Twitter OSINT for: {username}")
 
-    user = get_user(username, token)
+    user = await asyncio.to_thread(get_user, username, token)
     if not user or "error" in user or "wait_seconds" in user:
         return user
 
@@ -100,47 +125,44 @@ def collect_osint(username, token):
         "user": user
     }
 
-    # Tweets
-    tweets = get_user_tweets(user_id, token)
-    if "wait_seconds" in tweets:
-        data["tweets"] = tweets
-        return data
-    data["tweets"] = tweets.get("data", [])
-
-    # Followers
-    followers = get_followers(user_id, token)
-    if "wait_seconds" in followers:
-        data["followers"] = followers
-        return data
-    data["followers"] = followers.get("data", [])
-
-    # Following
-    following = get_following(user_id, token)
-    if "wait_seconds" in following:
-        data["following"] = following
-        return data
-    data["following"] = following.get("data", [])
+    # Tweets, followers and following are independent once the user id is
+    # known, so issue them concurrently instead of back to back.
+    tweets, followers, following = await asyncio.gather(
+        asyncio.to_thread(get_user_tweets, user_id, token),
+        asyncio.to_thread(get_followers, user_id, token),
+        asyncio.to_thread(get_following, user_id, token),
+    )
+
+    for key, resp in (("tweets", tweets), ("followers", followers), ("following", following)):
+        # A rate-limited section keeps its wait_seconds hint; the others
+        # still carry whatever data came back.
+        data[key] = resp if "wait_seconds" in resp else resp.get("data", [])
 
     return data
 
 
+def collect_osint(username, token):
+    return asyncio.run(_collect_osint_async(username, token))
+
+
 # -----------------------------
 # Save JSON to osint_results folder
 # -----------------------------
-def save_twitter_result(username, data):
-    # Remove previous files
-    for old_file in OSINT_RESULTS_DIR.glob(f"{username}_Twitter_*.json"):
-        try:
-            old_file.unlink()
-        except Exception as e:
-            logging.warning(f"Failed to delete old file {old_file}: {e}")
-
-    # Save new file
-    timestamp = int(datetime.utcnow().timestamp())
-    file_path = OSINT_RESULTS_DIR / f"{username}_Twitter_{timestamp}.json"
+def save_twitter_result(username, data, pretty=False):
+    # One canonical file per username, replaced atomically: no directory
+    # scan to prune stale timestamped copies, and readers never observe a
+    # partially written file.
+    file_path = OSINT_RESULTS_DIR / f"{username}_Twitter.json"
+    tmp_path = file_path.with_suffix(".json.tmp")
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        elif pretty:
+            tmp_path.write_bytes(json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
+        else:
+            tmp_path.write_bytes(
+                json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+        os.replace(tmp_path, file_path)
         logging.info(f"[+] Saved Twitter OSINT for {username} → {file_path}")
     except Exception as e:
         logging.error(f"[!] Failed to save Twitter OSINT: {e}")
@@ -160,5 +182,5 @@ if __name__ == "__main__":
     token = sys.argv[2]
 
     data = collect_osint(username, token)
-    save_twitter_result(username, data)
+    save_twitter_result(username, data, pretty=True)
     print(f"✔️ Twitter OSINT saved in osint_results folder")